@@ -1,7 +1,13 @@
 """The Bose component."""
 
 import asyncio
+import base64
+from contextlib import suppress
+from itertools import chain
 import json
+import logging
+import time
+from typing import Any
 
 from pybose.BoseAuth import BoseAuth
 from pybose.BoseResponse import Accessories, NetworkStateEnum
@@ -18,11 +24,32 @@ from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationErr
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 
 from . import config_flow
-from .const import _LOGGER, DOMAIN, TOKEN_REFRESH_DELAY, TOKEN_RETRY_DELAY
+from .const import (
+    DOMAIN,
+    TOKEN_REFRESH_SAFETY,
+    TOKEN_RETRY_DELAY,
+    TOKEN_RETRY_MAX_DELAY,
+)
+from .bose.dispatcher import BoseDispatcher
 from .coordinator import BoseCoordinator
 
+_LOGGER = logging.getLogger(__name__)
+
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+PLATFORMS = [
+    "media_player",
+    "select",
+    "number",
+    "sensor",
+    "binary_sensor",
+    "switch",
+    "button",
+]
+
+# Discovery results are shared between config entries for this many seconds
+DISCOVERY_CACHE_TTL = 30
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up Bose integration from a config entry."""
@@ -32,7 +59,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     # Store device data in a separate dict (instead of modifying config_entry.data)
     hass.data[DOMAIN][config_entry.entry_id] = {
-        "config": config_entry.data  # Store configuration data
+        "config": config_entry.data,  # Store configuration data
+        "auth_lock": asyncio.Lock(),  # At most one token refresh in flight
     }
 
     if (
@@ -41,7 +69,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         and config_entry.data.get("bose_person_id") is not None
         and config_entry.data.get("azure_refresh_token") is not None
     ):
-        # Using existing access token
+        # Using existing access token. Both setters are plain attribute
+        # assignments in pybose (no JWT parsing), so they stay on the loop.
         _LOGGER.debug("Using existing access token for %s", config_entry.data["mail"])
         auth.set_access_token(
             config_entry.data["access_token"],
@@ -60,35 +89,34 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             f"Authentication required for {config_entry.data.get('mail')}"
         )
 
-    hass.async_create_background_task(
-        refresh_token_thread(hass, config_entry, auth), "Refresh token"
+    # Tied to the entry so unloading it cancels the refresh loop
+    config_entry.async_create_background_task(
+        hass,
+        refresh_token_thread(hass, config_entry, auth),
+        "Refresh token",
+        eager_start=True,
     )
 
     speaker = await connect_to_bose(hass, config_entry, auth)
 
     if not speaker:
-        discovered = await config_flow.Discover_Bose_Devices(hass)
-        found = False
-
         # find the devce with the same GUID
-        for device in discovered:
-            if device["guid"] == config_entry.data["guid"]:
-                _LOGGER.error(
-                    "Found device with same GUID, updating IP to: %s", device["ip"]
-                )
-                hass.config_entries.async_update_entry(
-                    config_entry,
-                    data={**config_entry.data, "ip": device["ip"]},
-                )
-                found = True
-                break
+        new_ip = await _async_lookup_ip(
+            hass, config_entry.data["guid"], config_entry.data["ip"]
+        )
 
-        if not found:
+        if new_ip is None:
             _LOGGER.error(
                 "Failed to connect to Bose speaker. No new ip was found, so assuming the device is offline"
             )
             return False
 
+        _LOGGER.error("Found device with same GUID, updating IP to: %s", new_ip)
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data={**config_entry.data, "ip": new_ip},
+        )
+
         new_entry = hass.config_entries.async_get_entry(config_entry.entry_id)
         if new_entry is None:
             _LOGGER.error("Config entry not found after updating IP, aborting setup")
@@ -100,10 +128,30 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         _LOGGER.error("Speaker object is None, cannot retrieve system info")
         return False
 
-    system_info = await speaker.get_system_info()
-    capabilities = await speaker.get_capabilities()
+    # These requests are independent of each other, so run them concurrently
+    system_info, capabilities = await asyncio.gather(
+        speaker.get_system_info(), speaker.get_capabilities()
+    )
+
+    # speaker.has_capability rebuilds the endpoint list on every call
+    endpoints = frozenset(
+        endpoint.get("endpoint")
+        for group in capabilities.get("group", [])
+        for endpoint in group.get("endpoints", [])
+    )
+    has_network_status = "/network/status" in endpoints
+    pending = [speaker.subscribe(), speaker.get_accessories()]
+    if has_network_status:
+        pending.append(speaker.get_network_status())
+    subscribe_result, accessories, *network_result = await asyncio.gather(
+        *pending, return_exceptions=True
+    )
+    if isinstance(subscribe_result, Exception):
+        raise subscribe_result
 
-    await speaker.subscribe()
+    # Not all Devices have accessories like "Bose Portable Smart Speaker"
+    if isinstance(accessories, Exception):
+        accessories = []
 
     # Register device in Home Assistant
     device_registry = dr.async_get(hass)
@@ -111,20 +159,29 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     identifiers = {(DOMAIN, config_entry.data["guid"])}
     connections = set()
 
-    if speaker.has_capability("/network/status"):
-        network_status = await speaker.get_network_status()
+    if has_network_status:
+        network_status = network_result[0]
+        if isinstance(network_status, Exception):
+            raise network_status
 
         primary_name = network_status.get("primary")
-        for interface in network_status.get("interfaces", []):
-            if (
-                interface.get("type") == primary_name
-                and interface.get("state", NetworkStateEnum.DOWN) == NetworkStateEnum.UP
-            ):
-                mac_address = interface.get("macAddress", "")
-                if mac_address:
-                    formatted_mac = dr.format_mac(mac_address)
-                    connections.add((dr.CONNECTION_NETWORK_MAC, formatted_mac))
-                break
+        interface = (
+            next(
+                (
+                    interface
+                    for interface in network_status.get("interfaces", ())
+                    if interface.get("type") == primary_name
+                    and interface.get("state") == NetworkStateEnum.UP
+                ),
+                None,
+            )
+            if primary_name
+            else None
+        )
+        if interface and interface.get("macAddress"):
+            connections.add(
+                (dr.CONNECTION_NETWORK_MAC, dr.format_mac(interface["macAddress"]))
+            )
 
     device_registry.async_get_or_create(
         config_entry_id=config_entry.entry_id,
@@ -138,45 +195,39 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     )
 
     # Store the speaker object separately
-    hass.data[DOMAIN][config_entry.entry_id]["speaker"] = speaker
-    hass.data[DOMAIN][config_entry.entry_id]["system_info"] = system_info
-    hass.data[DOMAIN][config_entry.entry_id]["capabilities"] = capabilities
-    hass.data[DOMAIN][config_entry.entry_id]["auth"] = auth
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    entry_data["speaker"] = speaker
+    entry_data["system_info"] = system_info
+    entry_data["capabilities"] = capabilities
+    entry_data["endpoints"] = endpoints
+    entry_data["auth"] = auth
+    entry_data["reconnect_lock"] = asyncio.Lock()
+    entry_data["dispatcher"] = BoseDispatcher(speaker)
 
     coordinator = BoseCoordinator(
         hass,
         speaker,
         config_entry.data["guid"],
     )
-    hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
+    entry_data["coordinator"] = coordinator
     await coordinator.async_config_entry_first_refresh()
+    # Warm the cache before the platforms' entities start asking for data
+    await coordinator.async_prime_cache(endpoints)
 
     try:
-        # Not all Devices have accessories like "Bose Portable Smart Speaker"
-        accessories = await speaker.get_accessories()
         await registerAccessories(hass, config_entry, accessories)
     except Exception:  # noqa: BLE001
         accessories = []
-    hass.data[DOMAIN][config_entry.entry_id]["accessories"] = accessories
+    entry_data["accessories"] = accessories
 
     hass.async_create_background_task(
         reconnection_monitor(hass, config_entry, auth),
         "Bose reconnection monitor",
+        eager_start=True,
     )
 
     # Forward to media player platform
-    await hass.config_entries.async_forward_entry_setups(
-        config_entry,
-        [
-            "media_player",
-            "select",
-            "number",
-            "sensor",
-            "binary_sensor",
-            "switch",
-            "button",
-        ],
-    )
+    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     return True
 
@@ -184,29 +235,36 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 async def refresh_token_thread(
     hass: HomeAssistant, config_entry: ConfigEntry, auth: BoseAuth
 ):
-    """Refresh the token periodically."""
+    """Refresh the token shortly before it expires."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    retry_delay = TOKEN_RETRY_DELAY
     while True:
-        if (
-            auth.get_token_validity_time() > 2 * TOKEN_REFRESH_DELAY
-        ):  # when token is valid for more than 2 * refresh-delay ...
-            _LOGGER.debug(
-                "Sleeping for %s seconds before refreshing", TOKEN_REFRESH_DELAY
-            )  # wait for 1 x refresh-delay before checking again
-            await asyncio.sleep(TOKEN_REFRESH_DELAY)
+        # Sleep until the token is about to expire instead of polling its
+        # validity, but never less than the retry delay so a short-lived or
+        # unreadable token can't turn this into a busy refresh loop
+        sleep_for = max(
+            _token_validity_time(auth, entry_data) - TOKEN_REFRESH_SAFETY,
+            TOKEN_RETRY_DELAY,
+        )
+        _LOGGER.debug("Sleeping for %s seconds before refreshing", sleep_for)
+        await asyncio.sleep(sleep_for)
+
+        # refresh_token skips the refresh if the token was renewed meanwhile
         _LOGGER.info("Refreshing token for %s", config_entry.data["mail"])
         try:
-            if not await refresh_token(hass, config_entry, auth):
-                _LOGGER.error(
-                    "Failed to refresh token for %s. Trying again in %s seconds",
-                    config_entry.data["mail"],
-                    TOKEN_RETRY_DELAY,
-                )
-            else:
+            if await refresh_token(hass, config_entry, auth):
                 _LOGGER.info(
                     "Token refreshed successfully for %s. New token valid for %s seconds",
                     config_entry.data["mail"],
-                    auth.get_token_validity_time(),
+                    _token_validity_time(auth, entry_data),
                 )
+                retry_delay = TOKEN_RETRY_DELAY
+                continue
+            _LOGGER.error(
+                "Failed to refresh token for %s. Trying again in %s seconds",
+                config_entry.data["mail"],
+                retry_delay,
+            )
         except ConfigEntryAuthFailed:
             # Token refresh failed due to authentication issue - trigger reauth flow
             _LOGGER.warning(
@@ -218,55 +276,103 @@ async def refresh_token_thread(
                     DOMAIN,
                     context={"source": "reauth", "entry_id": config_entry.entry_id},
                     data=config_entry.data,
-                )
+                ),
+                eager_start=True,
             )
             # Stop the refresh loop after triggering reauth
             break
-        await asyncio.sleep(TOKEN_RETRY_DELAY)
+        await asyncio.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, TOKEN_RETRY_MAX_DELAY)
 
 
 async def refresh_token(hass: HomeAssistant, config_entry: ConfigEntry, auth: BoseAuth):
     """Refresh the token."""
-    try:
-        new_token = await hass.async_add_executor_job(auth.do_token_refresh)
-        if new_token:
-            # Get the updated Azure refresh token from auth object
-            azure_refresh_token = auth.get_azure_refresh_token()
-
-            update_data = {
-                **config_entry.data,
-                "access_token": new_token["access_token"],
-                "refresh_token": new_token["refresh_token"],
-            }
-
-            # Update Azure refresh token if available
-            if azure_refresh_token:
-                update_data["azure_refresh_token"] = azure_refresh_token
+    entry_data = hass.data[DOMAIN].get(config_entry.entry_id)
+    if entry_data is None:
+        _LOGGER.debug("Config entry unloaded, not refreshing token")
+        return False
 
-            hass.config_entries.async_update_entry(
-                config_entry,
-                data=update_data,
-            )
-            _LOGGER.info(
-                "Token is valid for %s seconds", auth.get_token_validity_time()
-            )
+    async with entry_data["auth_lock"]:
+        # A concurrent caller may have refreshed the token while we waited
+        if _token_validity_time(auth, entry_data) > TOKEN_REFRESH_SAFETY:
             return True
-    except Exception as e:
-        error_msg = str(e)
-        _LOGGER.error(
-            "Failed to refresh token for %s: %s", config_entry.data["mail"], error_msg
-        )
 
-        # Check if this is an authentication error that requires reauthentication
-        if "refresh token" in error_msg.lower() or "azure" in error_msg.lower():
-            _LOGGER.warning(
-                "Refresh token invalid for %s, triggering reauthentication flow",
+        try:
+            new_token = await hass.async_add_executor_job(auth.do_token_refresh)
+            if new_token:
+                # Get the updated Azure refresh token from auth object
+                azure_refresh_token = auth.get_azure_refresh_token()
+
+                update_data = {
+                    **config_entry.data,
+                    "access_token": new_token["access_token"],
+                    "refresh_token": new_token["refresh_token"],
+                }
+
+                # Update Azure refresh token if available
+                if azure_refresh_token:
+                    update_data["azure_refresh_token"] = azure_refresh_token
+
+                hass.config_entries.async_update_entry(
+                    config_entry,
+                    data=update_data,
+                )
+                _LOGGER.info(
+                    "Token is valid for %s seconds",
+                    _token_validity_time(auth, entry_data),
+                )
+                return True
+        except Exception as e:
+            error_msg = str(e)
+            _LOGGER.error(
+                "Failed to refresh token for %s: %s",
                 config_entry.data["mail"],
+                error_msg,
             )
-            raise ConfigEntryAuthFailed(
-                f"Refresh token invalid for {config_entry.data['mail']}"
-            ) from e
-    return False
+
+            # Check if this is an authentication error that requires reauthentication
+            if "refresh token" in error_msg.lower() or "azure" in error_msg.lower():
+                _LOGGER.warning(
+                    "Refresh token invalid for %s, triggering reauthentication flow",
+                    config_entry.data["mail"],
+                )
+                raise ConfigEntryAuthFailed(
+                    f"Refresh token invalid for {config_entry.data['mail']}"
+                ) from e
+        return False
+
+
+def _token_expiry(access_token: str) -> int | None:
+    """Return the exp claim of a JWT access token, or None if it has none."""
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return int(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _token_validity_time(auth: BoseAuth, entry_data: dict[str, Any]) -> int:
+    """Return the number of seconds until the current access token expires.
+
+    The entry keeps its last (token, exp) pair, so a token is decoded once.
+    Tokens without a readable exp claim fall back to pybose's own check.
+    """
+    token = auth.getCachedToken()
+    access_token = token.get("access_token") if token else None
+    if not access_token:
+        return 0
+    memo = entry_data.get("token_expiry")
+    if memo is None or memo[0] != access_token:
+        memo = entry_data["token_expiry"] = (
+            access_token,
+            _token_expiry(access_token),
+        )
+    if memo[1] is None:
+        return auth.get_token_validity_time()
+    return max(0, memo[1] - int(time.time()))
 
 
 async def reconnection_monitor(
@@ -283,12 +389,23 @@ async def reconnection_monitor(
             _LOGGER.debug("Config entry removed, stopping reconnection monitor")
             break
 
-        speaker = hass.data[DOMAIN].get(config_entry.entry_id, {}).get("speaker")
+        entry_data = hass.data[DOMAIN].get(config_entry.entry_id, {})
+        speaker = entry_data.get("speaker")
         if not speaker:
             _LOGGER.debug("Speaker object not found, stopping reconnection monitor")
             break
 
-        if not speaker.is_connected():
+        if speaker.is_connected():
+            continue
+
+        reconnect_lock: asyncio.Lock = entry_data["reconnect_lock"]
+        if reconnect_lock.locked():
+            _LOGGER.debug(
+                "Reconnection to %s already in progress", config_entry.data.get("guid")
+            )
+            continue
+
+        async with reconnect_lock:
             _LOGGER.warning(
                 "Speaker %s is disconnected, attempting reconnection via mDNS discovery",
                 config_entry.data.get("guid"),
@@ -296,108 +413,98 @@ async def reconnection_monitor(
 
             await asyncio.sleep(RECONNECT_DELAY)
 
-            try:
-                discovered = await config_flow.Discover_Bose_Devices(hass)
-                found = False
-
-                for device in discovered:
-                    if device["guid"] == config_entry.data["guid"]:
-                        current_ip = config_entry.data.get("ip")
-                        new_ip = device["ip"]
-
-                        if current_ip != new_ip:
-                            _LOGGER.info(
-                                "Device %s found with new IP %s (was %s), updating configuration",
-                                config_entry.data["guid"],
-                                new_ip,
-                                current_ip,
-                            )
-                            hass.config_entries.async_update_entry(
-                                config_entry,
-                                data={**config_entry.data, "ip": new_ip},
-                            )
-                        else:
-                            _LOGGER.info(
-                                "Device %s found at same IP %s, attempting reconnection",
-                                config_entry.data["guid"],
-                                current_ip,
-                            )
-
-                        new_speaker = await connect_to_bose(
-                            hass,
-                            hass.config_entries.async_get_entry(config_entry.entry_id)
-                            or config_entry,
-                            auth,
-                        )
-
-                        if new_speaker:
-                            try:
-                                await speaker.disconnect()
-                            except Exception:  # noqa: BLE001
-                                pass
-
-                            hass.data[DOMAIN][config_entry.entry_id][
-                                "speaker"
-                            ] = new_speaker
-                            coordinator = hass.data[DOMAIN][config_entry.entry_id].get(
-                                "coordinator"
-                            )
-                            if coordinator:
-                                coordinator.speaker = new_speaker
-                                new_speaker.attach_receiver(
-                                    coordinator._cache_message  # noqa: SLF001
-                                )
-
-                            await new_speaker.subscribe()
-
-                            _LOGGER.info(
-                                "Successfully reconnected to device %s at %s",
-                                config_entry.data["guid"],
-                                device["ip"],
-                            )
-                            found = True
-                        break
-
-                if not found:
-                    _LOGGER.warning(
-                        "Device %s not found via mDNS discovery, will retry",
-                        config_entry.data["guid"],
+            if speaker.is_connected():
+                continue
+
+            await _async_reconnect(hass, config_entry, auth, speaker)
+
+
+async def _async_reconnect(
+    hass: HomeAssistant, config_entry: ConfigEntry, auth: BoseAuth, speaker
+):
+    """Rediscover the speaker and replace the disconnected speaker object."""
+    try:
+        new_ip = await _async_lookup_ip(
+            hass, config_entry.data["guid"], config_entry.data.get("ip")
+        )
+        found = False
+
+        if new_ip is not None:
+            current_ip = config_entry.data.get("ip")
+
+            if current_ip != new_ip:
+                _LOGGER.info(
+                    "Device %s found with new IP %s (was %s), updating configuration",
+                    config_entry.data["guid"],
+                    new_ip,
+                    current_ip,
+                )
+                hass.config_entries.async_update_entry(
+                    config_entry,
+                    data={**config_entry.data, "ip": new_ip},
+                )
+            else:
+                _LOGGER.info(
+                    "Device %s found at same IP %s, attempting reconnection",
+                    config_entry.data["guid"],
+                    current_ip,
+                )
+
+            new_speaker = await connect_to_bose(
+                hass,
+                hass.config_entries.async_get_entry(config_entry.entry_id)
+                or config_entry,
+                auth,
+            )
+
+            if new_speaker:
+                with suppress(Exception):
+                    await speaker.disconnect()
+
+                entry_data = hass.data[DOMAIN][config_entry.entry_id]
+                entry_data["speaker"] = new_speaker
+                coordinator = entry_data.get("coordinator")
+                if coordinator:
+                    coordinator.speaker = new_speaker
+                    new_speaker.attach_receiver(
+                        coordinator._on_speaker_message  # noqa: SLF001
                     )
+                entry_data["dispatcher"].attach(new_speaker)
+
+                await new_speaker.subscribe()
 
-            except Exception:  # noqa: BLE001
-                _LOGGER.exception(
-                    "Error during reconnection attempt for %s",
+                _LOGGER.info(
+                    "Successfully reconnected to device %s at %s",
                     config_entry.data["guid"],
+                    new_ip,
                 )
+                found = True
+
+        if not found:
+            _LOGGER.warning(
+                "Device %s not found via mDNS discovery, will retry",
+                config_entry.data["guid"],
+            )
+
+    except Exception:  # noqa: BLE001
+        _LOGGER.exception(
+            "Error during reconnection attempt for %s",
+            config_entry.data["guid"],
+        )
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    # Disconnect from the speaker
+    # Disconnect from the speaker while the platforms are unloaded
     speaker: BoseSpeaker = hass.data[DOMAIN][config_entry.entry_id].get("speaker")
+    pending = [hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)]
     if speaker:
-        await speaker.disconnect()
+        pending.append(speaker.disconnect())
+    unload_ok, *_ = await asyncio.gather(*pending)
 
     # Remove our stored data
     hass.data[DOMAIN].pop(config_entry.entry_id, None)
 
-    # Unload each platform we originally set up
-    platforms = [
-        "media_player",
-        "select",
-        "number",
-        "sensor",
-        "binary_sensor",
-        "switch",
-        "button",
-    ]
-    unload_ok = True
-    for platform in platforms:
-        ok = await hass.config_entries.async_forward_entry_unload(
-            config_entry, platform
-        )
-        unload_ok = unload_ok and ok
-
     return unload_ok
 
 
@@ -427,9 +534,7 @@ def setup(hass: HomeAssistant, config: ConfigEntry) -> bool:
                 f"No device found in Home Assistant for device_id: {ha_device_id}"
             )
 
-        device_registry = dr.async_get(hass)
-        device_entry = device_registry.async_get(ha_device_id)
-        if device_entry is None or device_entry.primary_config_entry is None:
+        if device_entry.primary_config_entry is None:
             raise ValueError(
                 f"No valid config entry found for Home Assistant device_id: {ha_device_id}"
             )
@@ -500,28 +605,52 @@ async def registerAccessories(
     subs = accessories.get("subs") or []
     rears_raw = accessories.get("rears") or []
 
-    rears: list = []
     if isinstance(rears_raw, dict):
-        for v in rears_raw.values():
-            if isinstance(v, list):
-                rears.extend(v)
-            else:
-                rears.append(v)
+        rears = chain.from_iterable(
+            v if isinstance(v, list) else (v,) for v in rears_raw.values()
+        )
     elif isinstance(rears_raw, list):
-        rears = list(rears_raw)
+        rears = rears_raw
     else:
-        rears = [rears_raw]
+        rears = (rears_raw,)
+
+    entry_id = config_entry.entry_id
+    via_device = (DOMAIN, config_entry.data["guid"])
+    existing = {
+        identifier: device
+        for device in dr.async_entries_for_config_entry(device_registry, entry_id)
+        for identifier in device.identifiers
+    }
+
+    for accessory in chain(subs, rears):
+        serial_number = accessory.get("serialnum", "N/A")
+        name = accessory.get("type", "").replace("_", " ")
+        sw_version = accessory.get("version", "N/A")
+
+        device = existing.get((DOMAIN, serial_number))
+        if device is not None:
+            changes = {
+                key: value
+                for key, value in (
+                    ("name", name),
+                    ("model", name),
+                    ("sw_version", sw_version),
+                )
+                if getattr(device, key) != value
+            }
+            if changes:
+                device_registry.async_update_device(device.id, **changes)
+            continue
 
-    for accessory in list(subs) + rears:
         device_registry.async_get_or_create(
-            config_entry_id=config_entry.entry_id,
-            identifiers={(DOMAIN, accessory.get("serialnum", "N/A"))},
-            serial_number=accessory.get("serialnum", "N/A"),
+            config_entry_id=entry_id,
+            identifiers={(DOMAIN, serial_number)},
+            serial_number=serial_number,
             manufacturer="Bose",
-            name=accessory.get("type", "").replace("_", " "),
-            model=accessory.get("type", "").replace("_", " "),
-            sw_version=accessory.get("version", "N/A"),
-            via_device=(DOMAIN, config_entry.data["guid"]),
+            name=name,
+            model=name,
+            sw_version=sw_version,
+            via_device=via_device,
         )
 
 
@@ -540,3 +669,63 @@ async def connect_to_bose(
         return None
 
     return speaker
+
+
+async def _cached_discover(
+    hass: HomeAssistant, ttl: float = DISCOVERY_CACHE_TTL, force_browse: bool = False
+):
+    """Discover Bose devices, sharing the result between concurrent callers.
+
+    Cached lookups and forced network browses are shared separately, so
+    several offline speakers reconnecting together trigger a single browse.
+    """
+    # Last discovery per mode: (start time, discovery task)
+    discoveries: dict[bool, tuple[float, asyncio.Task]] = hass.data[DOMAIN].setdefault(
+        "_discovery", {}
+    )
+    cached = discoveries.get(force_browse)
+    if cached is not None:
+        started, task = cached
+        if not task.done() or (
+            time.monotonic() - started < ttl
+            and not task.cancelled()
+            and task.exception() is None
+        ):
+            return await asyncio.shield(task)
+
+    task = hass.async_create_task(
+        config_flow.Discover_Bose_Devices(hass, force_browse=force_browse),
+        "Bose discovery",
+        eager_start=True,
+    )
+    discoveries[force_browse] = (time.monotonic(), task)
+    return await asyncio.shield(task)
+
+
+async def _async_lookup_ip(
+    hass: HomeAssistant, guid: str, failed_ip: str | None = None
+) -> str | None:
+    """Return the IP of the device with the given GUID.
+
+    If failed_ip is given, a previously discovered IP that differs from it is
+    tried first without broadcasting again. When the cached discovery does not
+    know the device, or still resolves it to failed_ip, the network is browsed.
+    """
+    ip_cache: dict[str, str] = hass.data[DOMAIN].setdefault("_ip_cache", {})
+    cached_ip = ip_cache.get(guid)
+    if failed_ip is not None and cached_ip not in (None, failed_ip):
+        return cached_ip
+
+    found_ip = None
+    for device in await _cached_discover(hass):
+        ip_cache[device["guid"]] = device["ip"]
+        if device["guid"] == guid:
+            found_ip = device["ip"]
+    if found_ip is not None and found_ip != failed_ip:
+        return found_ip
+
+    for device in await _cached_discover(hass, force_browse=True):
+        ip_cache[device["guid"]] = device["ip"]
+        if device["guid"] == guid:
+            found_ip = device["ip"]
+    return found_ip
@@ -13,6 +13,7 @@ from pybose import BoseSpeaker
 
 from .bose.battery import BoseBatteryBase
 from .const import DOMAIN
+from .coordinator import BoseCoordinator
 from .entity import BoseBaseEntity
 
 
@@ -23,11 +24,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bose battery sensor if supported."""
     speaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
+    endpoints = hass.data[DOMAIN][config_entry.entry_id]["endpoints"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    if speaker.has_capability("/system/battery"):
+    if "/system/battery" in endpoints:
         async_add_entities(
             [
-                BoseBatteryChargingSensor(speaker, None, config_entry, hass),
+                BoseBatteryChargingSensor(
+                    speaker, None, config_entry, hass, coordinator
+                ),
             ],
         )
 
@@ -41,11 +46,12 @@ class BoseBatteryChargingSensor(BoseBaseEntity, BoseBatteryBase, BinarySensorEnt
         battery_status: Battery | None,
         config_entry: ConfigEntry,
         hass: HomeAssistant,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize charging state sensor."""
         # Initialize base entity and battery base
         BoseBaseEntity.__init__(self, speaker)
-        BoseBatteryBase.__init__(self, speaker, config_entry, hass)
+        BoseBatteryBase.__init__(self, speaker, config_entry, hass, coordinator)
         self._attr_translation_key = "charging_state"
         self._attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
 
@@ -54,6 +60,11 @@ class BoseBatteryChargingSensor(BoseBaseEntity, BoseBatteryBase, BinarySensorEnt
         else:
             self.update_from_battery_status(battery_status)
 
+    async def async_added_to_hass(self) -> None:
+        """Fetch the initial battery status once the entity is added."""
+        await super().async_added_to_hass()
+        await self.async_update()
+
     def update_from_battery_status(self, battery_status: Battery | None):
         """Update sensor state."""
         if not battery_status:
@@ -61,4 +72,4 @@ class BoseBatteryChargingSensor(BoseBaseEntity, BoseBatteryBase, BinarySensorEnt
             return
 
         self._attr_available = True
-        self.is_on = battery_status.get("chargerConnected", False) == "CONNECTED"
+        self._attr_is_on = battery_status.get("chargerConnected", False) == "CONNECTED"
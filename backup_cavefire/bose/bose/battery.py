@@ -5,6 +5,7 @@ entities. It intentionally does not inherit from Home Assistant
 Entity classes to avoid multiple-inheritance conflicts.
 """
 
+import logging
 from typing import Any, cast
 
 from pybose.BoseResponse import Battery
@@ -13,9 +14,11 @@ from pybose.BoseSpeaker import BoseSpeaker
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from ..const import _LOGGER, DOMAIN
+from ..const import DOMAIN
 from ..coordinator import BoseCoordinator
 
+_LOGGER = logging.getLogger(__name__)
+
 
 def dummy_battery_status() -> Battery:
     """Return dummy battery status. Used for testing."""
@@ -34,6 +37,8 @@ def dummy_battery_status() -> Battery:
 class BoseBatteryBase:
     """Helper mixin for Bose battery sensors."""
 
+    RESOURCE = "/system/battery"
+
     def __init__(
         self,
         speaker: BoseSpeaker,
@@ -45,19 +50,18 @@ class BoseBatteryBase:
         self.speaker = speaker
         self.config_entry = config_entry
         self.coordinator = coordinator
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.data["guid"])},
-        }
-
-        self.speaker.attach_receiver(self._parse_message)
         self.hass = hass
 
-        hass.async_create_task(self.async_update())
+        self._dispatcher = hass.data[DOMAIN][config_entry.entry_id]["dispatcher"]
+        self._message_resource = self.RESOURCE
 
-    def _parse_message(self, data):
-        """Parse real-time messages from the speaker."""
-        if data.get("header", {}).get("resource") == "/system/battery":
-            self.update_from_battery_status(Battery(data.get("body")))
+    def _parse_message(self, body):
+        """Parse real-time battery messages from the speaker."""
+        previous = self._pushed_state()
+        self.update_from_battery_status(Battery(body))
+        # Periodic pushes often repeat the last status; skip the state write
+        if self.hass and self._pushed_state() != previous:
+            self.async_write_ha_state()
 
     def update_from_battery_status(self, battery_status: Battery):
         """Implmented in sensor."""
@@ -70,7 +74,11 @@ class BoseBatteryBase:
         if not getattr(self, "hass", None):
             return
         try:
-            battery_data = await self.coordinator.get_battery_status()
+            # Use the coordinator cache directly when it is warm, only
+            # awaiting a speaker round-trip on a miss
+            battery_data = self.coordinator.get_cached_data(self.RESOURCE)
+            if battery_data is None:
+                battery_data = await self.coordinator.get_battery_status()
             battery_status = Battery(battery_data)
             self.update_from_battery_status(battery_status)
             self.async_write_ha_state()
@@ -0,0 +1,51 @@
+"""Message dispatcher for Bose integration.
+
+This module provides a single per-speaker receiver that routes real-time
+messages to the callbacks subscribed to their resource path, instead of
+every helper mixin attaching its own receiver to the speaker.
+"""
+
+from collections.abc import Callable
+import logging
+from typing import Any
+
+from pybose.BoseSpeaker import BoseSpeaker
+
+_LOGGER = logging.getLogger(__name__)
+
+MessageCallback = Callable[[dict[str, Any]], None]
+
+
+class BoseDispatcher:
+    """Route speaker messages to subscribers by resource."""
+
+    def __init__(self, speaker: BoseSpeaker) -> None:
+        """Initialize the dispatcher and attach it to the speaker."""
+        self._subs: dict[str, list[MessageCallback]] = {}
+        self.attach(speaker)
+
+    def attach(self, speaker: BoseSpeaker) -> None:
+        """Attach the dispatcher to a (new) speaker connection."""
+        speaker.attach_receiver(self._dispatch)  # type: ignore[arg-type]
+
+    def subscribe(self, resource: str, callback: MessageCallback) -> Callable[[], None]:
+        """Subscribe to message bodies for a resource. Returns an unsubscribe."""
+        subs = self._subs.setdefault(resource, [])
+        subs.append(callback)
+        return lambda: subs.remove(callback)
+
+    def _dispatch(self, data: dict[str, Any]) -> None:
+        """Forward a message body to the subscribers of its resource."""
+        header = data.get("header")
+        if header is None:
+            return
+        resource = header.get("resource")
+        callbacks = self._subs.get(resource)
+        if callbacks:
+            body = data.get("body")
+            for callback in callbacks:
+                # One failing subscriber must not stop delivery to the rest
+                try:
+                    callback(body)
+                except Exception:
+                    _LOGGER.exception("Error handling message for %s", resource)
@@ -5,18 +5,24 @@ entities. It intentionally does not inherit from Home Assistant
 Entity classes to avoid multiple-inheritance conflicts.
 """
 
+import logging
+
 from pybose.BoseResponse import NetworkStatus
 from pybose.BoseSpeaker import BoseSpeaker
 
-from ..const import _LOGGER, DOMAIN
+from ..const import DOMAIN
 from ..coordinator import BoseCoordinator
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class BoseNetworkBase:
     """Helper mixin for Bose network sensors."""
 
+    RESOURCE = "/network/status"
+
     def __init__(
         self,
         speaker: BoseSpeaker,
@@ -28,19 +34,19 @@ class BoseNetworkBase:
         self.speaker = speaker
         self.config_entry = config_entry
         self.coordinator = coordinator
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.data["guid"])},
-        }
-
-        self.speaker.attach_receiver(self._parse_message)
         self.hass = hass
 
-    def _parse_message(self, data):
-        """Parse real-time messages from the speaker."""
-        if data.get("header", {}).get("resource") == "/network/status":
-            self.update_from_network_status(NetworkStatus(data.get("body")))
-            if self.hass and hasattr(self, "async_write_ha_state"):
-                self.async_write_ha_state()
+        self._dispatcher = hass.data[DOMAIN][config_entry.entry_id]["dispatcher"]
+        self._message_resource = self.RESOURCE
+
+    def _parse_message(self, body):
+        """Parse real-time network status messages from the speaker."""
+        previous = self._pushed_state()
+        # NetworkStatus is a TypedDict; calling it would only copy the dict
+        self.update_from_network_status(body)
+        # Periodic pushes often repeat the last status; skip the state write
+        if self.hass and self._pushed_state() != previous:
+            self.async_write_ha_state()
 
     def update_from_network_status(self, network_status: NetworkStatus):
         """Implemented in sensor."""
@@ -51,9 +57,12 @@ class BoseNetworkBase:
     async def async_update(self) -> None:
         """Fetch the latest network status."""
         try:
-            network_data = await self.coordinator.get_network_status()
-            network_status = NetworkStatus(network_data)
-            self.update_from_network_status(network_status)
+            # Use the coordinator cache directly when it is warm, only
+            # awaiting a speaker round-trip on a miss
+            network_data = self.coordinator.get_cached_data(self.RESOURCE)
+            if network_data is None:
+                network_data = await self.coordinator.get_network_status()
+            self.update_from_network_status(network_data)
         except Exception:  # noqa: BLE001
             _LOGGER.exception(
                 "Error updating network status for %s", self.config_entry.data["ip"]
@@ -5,19 +5,25 @@ entities. It intentionally does not inherit from Home Assistant
 Entity classes to avoid multiple-inheritance conflicts.
 """
 
+import logging
+
 from pybose.BoseResponse import WifiStatus
 from pybose.BoseSpeaker import BoseSpeaker
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from ..const import _LOGGER, DOMAIN
+from ..const import DOMAIN
 from ..coordinator import BoseCoordinator
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class BoseWifiBase:
     """Helper mixin for Bose WiFi sensors."""
 
+    RESOURCE = "/network/wifi/status"
+
     def __init__(
         self,
         speaker: BoseSpeaker,
@@ -29,19 +35,18 @@ class BoseWifiBase:
         self.speaker = speaker
         self.config_entry = config_entry
         self.coordinator = coordinator
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.data["guid"])},
-        }
-
-        self.speaker.attach_receiver(self._parse_message)
         self.hass = hass
 
-    def _parse_message(self, data):
-        """Parse real-time messages from the speaker."""
-        if data.get("header", {}).get("resource") == "/network/wifi/status":
-            self.update_from_wifi_status(WifiStatus(data.get("body")))
-            if self.hass and hasattr(self, "async_write_ha_state"):
-                self.async_write_ha_state()
+        self._dispatcher = hass.data[DOMAIN][config_entry.entry_id]["dispatcher"]
+        self._message_resource = self.RESOURCE
+
+    def _parse_message(self, body):
+        """Parse real-time WiFi status messages from the speaker."""
+        previous = self._pushed_state()
+        self.update_from_wifi_status(WifiStatus(body))
+        # Periodic pushes often repeat the last status; skip the state write
+        if self.hass and self._pushed_state() != previous:
+            self.async_write_ha_state()
 
     def update_from_wifi_status(self, wifi_status: WifiStatus):
         """Implemented in sensor."""
@@ -50,7 +55,11 @@ class BoseWifiBase:
     async def async_update(self) -> None:
         """Fetch the latest WiFi status."""
         try:
-            wifi_data = await self.coordinator.get_wifi_status()
+            # Use the coordinator cache directly when it is warm, only
+            # awaiting a speaker round-trip on a miss
+            wifi_data = self.coordinator.get_cached_data(self.RESOURCE)
+            if wifi_data is None:
+                wifi_data = await self.coordinator.get_wifi_status()
             wifi_status = WifiStatus(wifi_data)
             self.update_from_wifi_status(wifi_status)
         except Exception:  # noqa: BLE001
@@ -1,5 +1,7 @@
 """Support for Bose power button."""
 
+import logging
+
 from pybose.BoseResponse import Preset
 from pybose.BoseSpeaker import BoseSpeaker
 
@@ -11,9 +13,11 @@ from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import _LOGGER, DOMAIN
+from .const import DOMAIN
 from .entity import BoseBaseEntity
 
+_LOGGER = logging.getLogger(__name__)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -22,18 +26,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bose buttons."""
     speaker: BoseSpeaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
+    endpoints = hass.data[DOMAIN][config_entry.entry_id]["endpoints"]
 
     presets = (
         (await speaker.get_product_settings()).get("presets", None).get("presets", [])
     )
 
-    entities: list[BoseBaseEntity] = [
-        BosePresetbutton(speaker, config_entry, preset, presetNum)
+    preset_map: dict[str, BosePresetbutton] = {
+        presetNum: BosePresetbutton(speaker, config_entry, preset, presetNum)
         for presetNum, preset in presets.items()
-    ]
+    }
+    entities: list[BoseBaseEntity] = list(preset_map.values())
 
     # Add Bluetooth pairing button if Bluetooth is supported
-    if speaker.has_capability("/bluetooth/sink/pairable"):
+    if "/bluetooth/sink/pairable" in endpoints:
         entities.append(BoseBluetoothPairButton(speaker, config_entry))
 
     # Add button entity with device info
@@ -43,26 +49,27 @@ async def async_setup_entry(
     )
 
     def parse_message(data):
-        resource = data.get("header", {}).get("resource")
+        header = data.get("header")
+        resource = header.get("resource") if header is not None else None
         body = data.get("body", {})
         if resource == "/system/productSettings":
             presets = body.get("presets", {}).get("presets", {})
 
-            processed_presets = []
-            for entity in entities:
-                # Only BosePresetbutton instances implement update_preset
-                if isinstance(entity, BosePresetbutton):
-                    entity.update_preset(presets.get(entity.preset_num))
-                    processed_presets.append(entity.preset_num)
-
+            new_entities = []
             for presetNum, preset in presets.items():
-                if presetNum not in processed_presets:
+                existing = preset_map.get(presetNum)
+                if existing is not None:
+                    existing.update_preset(preset)
+                else:
                     entity = BosePresetbutton(speaker, config_entry, preset, presetNum)
-                    entities.append(entity)
-                    async_add_entities(
-                        [entity],
-                        update_before_add=False,
-                    )
+                    preset_map[presetNum] = entity
+                    new_entities.append(entity)
+
+            if new_entities:
+                async_add_entities(
+                    new_entities,
+                    update_before_add=False,
+                )
 
     speaker.attach_receiver(parse_message)
 
@@ -81,27 +88,33 @@ class BosePresetbutton(BoseBaseEntity, ButtonEntity):
 
         BoseBaseEntity.__init__(self, speaker)
         self._speaker = speaker
-        self._attr_name = f"Preset {presetNum}"
         self._preset = preset
         self.preset_num = presetNum
         self.config_entry = config_entry
         self._attr_icon = "mdi:folder-play"
+        self._last_signature: tuple[str | None, str | None] | None = None
         self.update_preset(preset)
 
     def update_preset(self, preset: Preset) -> None:
         """Update the preset."""
         self._preset = preset
-        self._attr_name = (
-            preset.get("actions")[0].get("payload").get("contentItem").get("name")
-        )
-        self.entity_picture = (
-            preset.get("actions")[0].get("payload").get("contentItem").get("imageUrl")
-        )
-        self._attr_entity_picture = (
-            preset.get("actions")[0].get("payload").get("contentItem").get("imageUrl")
-        )
+        content_item = preset["actions"][0]["payload"]["contentItem"]
+        name = content_item.get("name")
+        image_url = content_item.get("imageUrl")
+
+        # productSettings is pushed often; skip writes when nothing changed
+        signature = (name, image_url)
+        if signature == self._last_signature:
+            return
+        name_changed = self._last_signature is None or name != self._last_signature[0]
+        self._last_signature = signature
+
+        self._attr_name = name or f"Preset {self.preset_num}"
+        self.entity_picture = image_url
+        self._attr_entity_picture = image_url
         if self.hass:
-            er.async_get(self.hass).async_update_entity(self.entity_id)
+            if name_changed:
+                er.async_get(self.hass).async_update_entity(self.entity_id)
             self.async_write_ha_state()
 
     async def async_press(self, **kwargs) -> None:
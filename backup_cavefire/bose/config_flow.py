@@ -1,11 +1,16 @@
 """Config flow for Bose integration."""
 
+import asyncio
+from functools import lru_cache
+import logging
+import time
 from typing import Any
 
 from pybose.BoseAuth import BoseAuth
-from pybose.BoseDiscovery import BoseDiscovery
 from pybose.BoseSpeaker import BoseSpeaker
 import voluptuous as vol
+from zeroconf import DNSPointer, ServiceInfo, ServiceStateChange, Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo
 
 from homeassistant import config_entries
 import homeassistant.components.zeroconf
@@ -14,26 +19,101 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector, translation as translation_helper
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
-from .const import _LOGGER, CONF_CHROMECAST_AUTO_ENABLE, DOMAIN
-
-
-async def Discover_Bose_Devices(hass: HomeAssistant):
-    """Discover devices using BoseDiscovery in an executor."""
+from .const import BOSE_SERVICE_TYPE, CONF_CHROMECAST_AUTO_ENABLE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# How long discovered IPs are reused across form renders
+DISCOVERY_CACHE_TTL = 30  # seconds
+
+# Sources that cannot be renamed or linked in the options flow
+EXCLUDED_SOURCE_PREFIXES = ("Bluetooth:", "Spotify:")
+EXCLUDED_SOURCES = frozenset({"Chromecast built-in"})
+
+
+@lru_cache(maxsize=256)
+def _source_keys(source: str) -> tuple[str, str]:
+    """Return the rename and linked player option keys for a source."""
+    base = source.replace(" ", "_").replace(":", "_")
+    return f"rename_{base}", f"linked_player_{base}"
+
+
+def _device_from_info(info: ServiceInfo) -> dict[str, str] | None:
+    """Return the GUID and IP of a resolved Bose service, if complete."""
+    guid = info.properties.get(b"GUID")
+    addresses = info.parsed_addresses()
+    if guid and addresses:
+        return {"GUID": guid.decode("utf-8"), "IP": addresses[0]}
+    return None
+
+
+def _async_cached_bose_devices(zeroconf: Zeroconf) -> list[dict[str, str]]:
+    """Return Bose devices already resolved in the shared zeroconf cache."""
+    devices = []
+    for record in zeroconf.cache.async_entries_with_name(BOSE_SERVICE_TYPE):
+        if not isinstance(record, DNSPointer):
+            continue
+        info = ServiceInfo(BOSE_SERVICE_TYPE, record.alias)
+        if info.load_from_cache(zeroconf) and (device := _device_from_info(info)):
+            devices.append(device)
+    return devices
+
+
+async def _async_browse_bose_devices(
+    zeroconf: Zeroconf, timeout: float = 1
+) -> list[dict[str, str]]:
+    """Browse for Bose services, then resolve them concurrently."""
+    names: set[str] = set()
+
+    def _on_service_state_change(
+        zeroconf: Zeroconf,
+        service_type: str,
+        name: str,
+        state_change: ServiceStateChange,
+    ) -> None:
+        if state_change is ServiceStateChange.Added:
+            names.add(name)
+
+    browser = AsyncServiceBrowser(
+        zeroconf, BOSE_SERVICE_TYPE, handlers=[_on_service_state_change]
+    )
+    try:
+        await asyncio.sleep(timeout)
+    finally:
+        await browser.async_cancel()
+
+    infos = [AsyncServiceInfo(BOSE_SERVICE_TYPE, name) for name in names]
+    await asyncio.gather(
+        *(info.async_request(zeroconf, timeout * 1000) for info in infos)
+    )
+    return [device for info in infos if (device := _device_from_info(info))]
+
+
+async def Discover_Bose_Devices(
+    hass: HomeAssistant, ips_only: bool = False, force_browse: bool = False
+):
+    """Discover Bose devices on the local network.
+
+    Devices already known to Home Assistant's zeroconf listener are
+    returned from its cache; the network is only browsed when it is empty,
+    or always with force_browse (the cache may miss a device or hold an old
+    address). With ips_only, return just the list of discovered IP addresses.
+    """
     zeroconf = await homeassistant.components.zeroconf.async_get_instance(hass)
 
-    def _run_discovery():
-        """Run the blocking discovery method."""
-        discovery = BoseDiscovery(zeroconf=zeroconf)
-        devices = discovery.discover_devices(timeout=1)
-        return [
-            {
-                "ip": device["IP"],
-                "guid": device["GUID"],
-            }
-            for device in devices
-        ]
+    devices = None if force_browse else _async_cached_bose_devices(zeroconf)
+    if not devices:
+        devices = await _async_browse_bose_devices(zeroconf)
 
-    return await hass.async_add_executor_job(_run_discovery)
+    if ips_only:
+        return [device["IP"] for device in devices]
+    return [
+        {
+            "ip": device["IP"],
+            "guid": device["GUID"],
+        }
+        for device in devices
+    ]
 
 
 class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -44,11 +124,14 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the Bose config flow."""
         self.discovered_ips = []  # List to store discovered IPs
+        self._discovered_at: float | None = None
         self.mail = None
         self.password = None
         self._auth = None
+        self._auth_credentials = None
         self._discovered_device = None
         self._reauth_entry = None
+        self._translations: dict[str, str] | None = None
 
     @staticmethod
     @callback
@@ -85,24 +168,24 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "auth_failed"
 
         # Perform discovery to populate the dropdown
-        if not self.discovered_ips:
+        if (
+            not self.discovered_ips
+            or self._discovered_at is None
+            or time.monotonic() - self._discovered_at > DISCOVERY_CACHE_TTL
+        ):
             try:
                 self.discovered_ips = await self._discover_devices()
+                self._discovered_at = time.monotonic()
             except Exception as e:  # noqa: BLE001
                 _LOGGER.exception("Discovery failed", exc_info=e)
                 self.discovered_ips = []
 
         ip_options = {ip: ip for ip in self.discovered_ips}
-        try:
-            translations = await translation_helper.async_get_translations(
-                self.hass, self.hass.config.language, "config", integrations=[DOMAIN]
-            )
-            manual_label = translations.get(
-                f"component.{DOMAIN}.config.step.user.data.manual_ip",
-                "Enter IP Manually",
-            )
-        except (ValueError, RuntimeError):
-            manual_label = "Enter IP Manually"
+        translations = await self._get_translations()
+        manual_label = translations.get(
+            f"component.{DOMAIN}.config.step.user.data.manual_ip",
+            "Enter IP Manually",
+        )
 
         ip_options["manual"] = manual_label
 
@@ -139,16 +222,11 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
         )
 
-        try:
-            translations = await translation_helper.async_get_translations(
-                self.hass, self.hass.config.language, "config", integrations=[DOMAIN]
-            )
-            manual_note = translations.get(
-                f"component.{DOMAIN}.config.step.user.data.manual_ip",
-                "Enter the IP address of your Bose device manually if it wasn't discovered.",
-            )
-        except (ValueError, RuntimeError):
-            manual_note = "Enter the IP address of your Bose device manually if it wasn't discovered."
+        translations = await self._get_translations()
+        manual_note = translations.get(
+            f"component.{DOMAIN}.config.step.user.data.manual_ip",
+            "Enter the IP address of your Bose device manually if it wasn't discovered.",
+        )
 
         return self.async_show_form(
             step_id="manual_ip",
@@ -157,29 +235,95 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"note": manual_note},
         )
 
+    async def _get_translations(self) -> dict[str, str]:
+        """Return the config translations, loading them once per flow."""
+        if self._translations is None:
+            try:
+                self._translations = await translation_helper.async_get_translations(
+                    self.hass,
+                    self.hass.config.language,
+                    "config",
+                    integrations=[DOMAIN],
+                )
+            except (ValueError, RuntimeError):
+                return {}
+        return self._translations
+
     async def _discover_devices(self):
-        """Discover devices using BoseDiscovery in an executor."""
-        devices = await Discover_Bose_Devices(self.hass)
-        return [device["ip"] for device in devices]
+        """Return the IP addresses of discovered Bose devices."""
+        return await Discover_Bose_Devices(self.hass, ips_only=True)
 
     def _login(self, email, password):
         """Authenticate and retrieve the control token."""
+        # Reuse the token from an earlier login in this flow (e.g. when the
+        # user retries after a device error) instead of logging in again
+        if self._auth is not None and self._auth_credentials == (email, password):
+            cached = self._auth.getCachedToken()
+            if cached and self._auth.is_token_valid():
+                _LOGGER.debug("Reusing cached control token for %s", email)
+                return cached
+
         try:
             _LOGGER.debug("Starting login process for %s", email)
+            self._auth_credentials = None
             self._auth = BoseAuth()
             result = self._auth.getControlToken(email, password, forceNew=True)
         except Exception:
             _LOGGER.exception("Failed to get control token for %s", email)
             return None
         else:
+            self._auth_credentials = (email, password)
             _LOGGER.info("Login successful for %s", email)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Login result keys: %s", list(result.keys()) if result else None
+                )
+            return result
+
+    def _extract_and_validate_tokens(
+        self, tokens: dict[str, Any] | None, azure_refresh_token: str | None
+    ) -> tuple[str | None, bool]:
+        """Return the Bose person ID and whether all required tokens are set."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "Login result keys: %s", list(result.keys()) if result else None
+                "Cached tokens retrieved: %s",
+                {
+                    "keys": list(tokens.keys()) if tokens else None,
+                    "has_azure_refresh_token": azure_refresh_token is not None,
+                },
             )
-            return result
+
+        if not tokens:
+            _LOGGER.error("Token validation failed - no cached tokens")
+            return None, False
+
+        # Check for both possible key names (API inconsistency)
+        bose_person_id = tokens.get("bosePersonID") or tokens.get("bose_person_id")
+        has_access = tokens.get("access_token") is not None
+        has_refresh = tokens.get("refresh_token") is not None
+
+        if (
+            bose_person_id is None
+            or not has_access
+            or not has_refresh
+            or azure_refresh_token is None
+        ):
+            _LOGGER.error(
+                "Token validation failed - bose_person_id: %s, has_access: %s, has_refresh: %s, has_azure_refresh: %s",
+                bose_person_id is not None,
+                has_access,
+                has_refresh,
+                azure_refresh_token is not None,
+            )
+            return bose_person_id, False
+        return bose_person_id, True
 
     async def _get_device_info(self, mail, password, ip):
         """Get the device info."""
+        # Fail before opening a connection when there are no credentials
+        if self._auth is None:
+            return self.async_abort(reason="auth_failed")
+
         try:
             speaker = BoseSpeaker(bose_auth=self._auth, host=ip)  # pyright: ignore[reportArgumentType]
             await speaker.connect()
@@ -195,38 +339,14 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(guid)
         self._abort_if_unique_id_configured()
 
-        if self._auth is None:
-            return self.async_abort(reason="auth_failed")
-
+        # Both getters only read BoseAuth attributes, no I/O on the loop
         tokens = self._auth.getCachedToken()
         azure_refresh_token = self._auth.get_azure_refresh_token()
 
-        _LOGGER.debug(
-            "Cached token keys from initial setup: %s",
-            list(tokens.keys()) if tokens else None,
+        bose_person_id, valid = self._extract_and_validate_tokens(
+            tokens, azure_refresh_token
         )
-
-        # Check for both possible key names (API inconsistency)
-        bose_person_id = (
-            tokens.get("bosePersonID") or tokens.get("bose_person_id")
-            if tokens
-            else None
-        )
-
-        if (
-            tokens is None
-            or bose_person_id is None
-            or tokens.get("access_token") is None
-            or tokens.get("refresh_token") is None
-            or azure_refresh_token is None
-        ):
-            _LOGGER.error(
-                "Token validation failed during initial setup - bose_person_id: %s, has_access: %s, has_refresh: %s, has_azure_refresh: %s",
-                bose_person_id is not None,
-                tokens.get("access_token") is not None if tokens else False,
-                tokens.get("refresh_token") is not None if tokens else False,
-                azure_refresh_token is not None,
-            )
+        if not valid:
             return self.async_abort(reason="auth_failed")
 
         return self.async_create_entry(
@@ -348,44 +468,10 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 tokens = self._auth.getCachedToken()
                 azure_refresh_token = self._auth.get_azure_refresh_token()
 
-                _LOGGER.debug(
-                    "Cached token keys: %s", list(tokens.keys()) if tokens else None
-                )
-                _LOGGER.debug(
-                    "Cached tokens retrieved: %s",
-                    {
-                        "has_tokens": tokens is not None,
-                        "has_bosePersonID": tokens.get("bosePersonID") is not None
-                        if tokens
-                        else False,
-                        "has_bose_person_id": tokens.get("bose_person_id") is not None
-                        if tokens
-                        else False,
-                        "has_access_token": tokens.get("access_token") is not None
-                        if tokens
-                        else False,
-                        "has_refresh_token": tokens.get("refresh_token") is not None
-                        if tokens
-                        else False,
-                        "has_azure_refresh_token": azure_refresh_token is not None,
-                    },
-                )
-
-                # Check for both possible key names
-                bose_person_id = (
-                    tokens.get("bosePersonID") or tokens.get("bose_person_id")
-                    if tokens
-                    else None
+                bose_person_id, valid = self._extract_and_validate_tokens(
+                    tokens, azure_refresh_token
                 )
-
-                if (
-                    tokens is None
-                    or bose_person_id is None
-                    or tokens.get("access_token") is None
-                    or tokens.get("refresh_token") is None
-                    or azure_refresh_token is None
-                ):
-                    _LOGGER.error("Token validation failed - missing required tokens")
+                if not valid:
                     errors["base"] = "auth_failed"
                 else:
                     old_person_id = self._reauth_entry.data.get("bose_person_id")
@@ -487,19 +573,18 @@ class BoseOptionsFlowHandler(OptionsFlow):
         filtered_sources = [
             source
             for source in self._original_sources
-            if not source.startswith("Bluetooth:")
-            and source != "Chromecast built-in"
-            and not source.startswith("Spotify:")
+            if not source.startswith(EXCLUDED_SOURCE_PREFIXES)
+            and source not in EXCLUDED_SOURCES
         ]
 
         if not filtered_sources:
             return self.async_abort(reason="no_sources_available")
 
-        current_options = self.config_entry.options
+        options = self.config_entry.options
         source_options = {}
         for source in filtered_sources:
-            rename_key = f"rename_{source.replace(' ', '_').replace(':', '_')}"
-            custom_name = current_options.get(rename_key)
+            rename_key, _ = _source_keys(source)
+            custom_name = options.get(rename_key)
             if custom_name:
                 display_name = f"{source} ({custom_name})"
             else:
@@ -525,13 +610,11 @@ class BoseOptionsFlowHandler(OptionsFlow):
         if not self._selected_source:
             return await self.async_step_source_settings()
 
-        if user_input is not None:
-            current_options = dict(self.config_entry.options)
+        options = self.config_entry.options
+        rename_key, source_key = _source_keys(self._selected_source)
 
-            source_key = f"linked_player_{self._selected_source.replace(' ', '_').replace(':', '_')}"
-            rename_key = (
-                f"rename_{self._selected_source.replace(' ', '_').replace(':', '_')}"
-            )
+        if user_input is not None:
+            current_options = dict(options)
 
             if user_input.get("rename"):
                 current_options[rename_key] = user_input["rename"]
@@ -548,16 +631,8 @@ class BoseOptionsFlowHandler(OptionsFlow):
             )
             return await self.async_step_init()
 
-        current_options = self.config_entry.options
-        source_key = (
-            f"linked_player_{self._selected_source.replace(' ', '_').replace(':', '_')}"
-        )
-        rename_key = (
-            f"rename_{self._selected_source.replace(' ', '_').replace(':', '_')}"
-        )
-
-        current_linked_value = current_options.get(source_key)
-        current_rename_value = current_options.get(rename_key, "")
+        current_linked_value = options.get(source_key)
+        current_rename_value = options.get(rename_key, "")
 
         data_schema = vol.Schema(
             {
@@ -591,8 +666,10 @@ class BoseOptionsFlowHandler(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure connectivity settings."""
+        options = self.config_entry.options
+
         if user_input is not None:
-            current_options = dict(self.config_entry.options)
+            current_options = dict(options)
             current_options[CONF_CHROMECAST_AUTO_ENABLE] = user_input.get(
                 CONF_CHROMECAST_AUTO_ENABLE, True
             )
@@ -601,10 +678,7 @@ class BoseOptionsFlowHandler(OptionsFlow):
             )
             return await self.async_step_init()
 
-        current_options = self.config_entry.options
-        current_chromecast_setting = current_options.get(
-            CONF_CHROMECAST_AUTO_ENABLE, True
-        )
+        current_chromecast_setting = options.get(CONF_CHROMECAST_AUTO_ENABLE, True)
 
         data_schema = vol.Schema(
             {
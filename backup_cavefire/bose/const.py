@@ -1,16 +1,16 @@
 """Constants for the Bose integration."""
 
-import logging
-
 DOMAIN = "bose"
 
-# Token Refresh Delay is how long between each check if the token is valid
-# Token Retry Delay is how long before each retry if refresh fails
-TOKEN_REFRESH_DELAY = 3600  # seconds
+# mDNS service type advertised by Bose speakers
+BOSE_SERVICE_TYPE = "_bose-passport._tcp.local."
+
+# Token Refresh Safety is how long before expiry the token gets refreshed
+# Token Retry Delay is how long before the first retry if refresh fails,
+# doubled on each further failure up to Token Retry Max Delay
+TOKEN_REFRESH_SAFETY = 60  # seconds
 TOKEN_RETRY_DELAY = 120  # seconds
+TOKEN_RETRY_MAX_DELAY = 3600  # seconds
 
 # Options key for Chromecast auto-enable setting
 CONF_CHROMECAST_AUTO_ENABLE = "chromecast_auto_enable"
-
-
-_LOGGER = logging.getLogger("bose")
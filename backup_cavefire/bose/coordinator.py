@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+import logging
+import time
 from typing import Any
 
 from pybose.BoseSpeaker import BoseSpeaker
@@ -11,30 +14,66 @@ from pybose.BoseSpeaker import BoseSpeaker
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import _LOGGER, DOMAIN
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
 
 # Cache expiry time in seconds
 CACHE_EXPIRY_SECONDS = 60
 
-
-@dataclass
+# Speaker resource paths used as cache keys
+RESOURCE_AUDIO_VOLUME = "/audio/volume"
+RESOURCE_NOW_PLAYING = "/content/nowPlaying"
+RESOURCE_BATTERY = "/system/battery"
+RESOURCE_BLUETOOTH_SINK_STATUS = "/bluetooth/sink/status"
+RESOURCE_BLUETOOTH_SINK_LIST = "/bluetooth/sink/list"
+RESOURCE_BLUETOOTH_SOURCE_STATUS = "/bluetooth/source/status"
+RESOURCE_WIFI_STATUS = "/network/wifi/status"
+RESOURCE_NETWORK_STATUS = "/network/status"
+RESOURCE_ACTIVE_GROUPS = "/grouping/activeGroups"
+
+# Audio setting options read through get_audio_setting
+_AUDIO_OPTIONS = (
+    "bass",
+    "treble",
+    "center",
+    "subwooferGain",
+    "surround",
+    "height",
+    "avSync",
+)
+# Per-option audio resource paths
+_AUDIO_RESOURCES: Mapping[str, str] = {
+    option: f"/audio/{option}" for option in _AUDIO_OPTIONS
+}
+
+# Resources the coordinator reads back; other pushed resources aren't cached
+_CACHEABLE_RESOURCES = frozenset(
+    {
+        *_AUDIO_RESOURCES.values(),
+        RESOURCE_AUDIO_VOLUME,
+        RESOURCE_NOW_PLAYING,
+        RESOURCE_BATTERY,
+        RESOURCE_BLUETOOTH_SINK_STATUS,
+        RESOURCE_BLUETOOTH_SINK_LIST,
+        RESOURCE_BLUETOOTH_SOURCE_STATUS,
+        RESOURCE_WIFI_STATUS,
+        RESOURCE_NETWORK_STATUS,
+        RESOURCE_ACTIVE_GROUPS,
+    }
+)
+
+
+@dataclass(slots=True)
 class CachedMessage:
     """Represents a cached message from the speaker."""
 
     resource: str
     body: dict[str, Any]
-    timestamp: datetime
-
-
-@dataclass
-class BoseCoordinatorData:
-    """Data class for coordinator state."""
-
-    cached_messages: dict[str, CachedMessage] = field(default_factory=dict)
-    last_update: datetime | None = None
+    timestamp: float  # time.monotonic() when cached
 
 
-class BoseCoordinator(DataUpdateCoordinator[BoseCoordinatorData]):
+class BoseCoordinator(DataUpdateCoordinator[dict[str, CachedMessage]]):
     """Coordinator to manage Bose speaker data and caching."""
 
     def __init__(
@@ -48,188 +87,251 @@ class BoseCoordinator(DataUpdateCoordinator[BoseCoordinatorData]):
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{device_id}",
-            update_interval=timedelta(minutes=5),
+            # Speaker data is pushed through _on_speaker_message; no polling
+            update_interval=None,
         )
         self.speaker = speaker
         self.device_id = device_id
 
-        # Initialize with empty data
-        self.data = BoseCoordinatorData()
+        # Cached messages keyed by resource, also exposed as coordinator data.
+        # Only the fixed set of resources read back is cached, so it's unbounded.
+        self._cache: dict[str, CachedMessage] = {}
+        self.data = self._cache
 
-        # Attach receiver to cache messages
-        self.speaker.attach_receiver(self._cache_message)  # type: ignore[arg-type]
+        # Background refreshes of stale resources, keyed by resource
+        self._in_flight: dict[str, asyncio.Task[None]] = {}
+        # First fetches of uncached resources, shared by concurrent callers
+        self._pending: dict[str, asyncio.Task[dict[str, Any]]] = {}
 
-    def _cache_message(self, data: dict[str, Any] | Any) -> None:
+        # Attach receiver to cache messages
+        self.speaker.attach_receiver(self._on_speaker_message)  # type: ignore[arg-type]
+
+    @property
+    def speaker(self) -> BoseSpeaker:
+        """Return the speaker the coordinator fetches from."""
+        return self._speaker
+
+    @speaker.setter
+    def speaker(self, speaker: BoseSpeaker) -> None:
+        """Set the speaker and rebind the per-resource fetchers."""
+        self._speaker = speaker
+        self._fetchers: dict[str, Callable[[], Awaitable[Any]]] = {
+            RESOURCE_AUDIO_VOLUME: speaker.get_audio_volume,
+            RESOURCE_NOW_PLAYING: speaker.get_now_playing,
+            RESOURCE_BATTERY: speaker.get_battery_status,
+            RESOURCE_BLUETOOTH_SINK_STATUS: speaker.get_bluetooth_sink_status,
+            RESOURCE_BLUETOOTH_SINK_LIST: speaker.get_bluetooth_sink_list,
+            RESOURCE_BLUETOOTH_SOURCE_STATUS: speaker.get_bluetooth_source_status,
+            RESOURCE_WIFI_STATUS: speaker.get_wifi_status,
+            RESOURCE_NETWORK_STATUS: speaker.get_network_status,
+        }
+
+    def _on_speaker_message(self, data: dict[str, Any] | Any) -> None:
         """Cache incoming messages from the speaker."""
-        # Handle both dict and BoseMessage objects
+        # pybose almost always delivers plain dicts
         if not isinstance(data, dict):
-            if hasattr(data, "to_dict"):
-                data = data.to_dict()  # type: ignore[union-attr]
-            elif hasattr(data, "__dict__"):
-                data = data.__dict__
-            else:
-                _LOGGER.debug("Received non-dict message that couldn't be converted")
-                return
+            data = self._convert_to_dict(data)
 
-        resource = data.get("header", {}).get("resource")
-        body = data.get("body", {})
+        header = data.get("header")
+        resource = header.get("resource") if header else None
 
-        if resource:
-            cached = CachedMessage(
-                resource=resource,
-                body=body,
-                timestamp=datetime.now(),
-            )
-            self.data.cached_messages[resource] = cached
-            _LOGGER.debug("Cached message for resource: %s", resource)
+        if resource not in _CACHEABLE_RESOURCES:
+            return
+
+        body = data.get("body", {})
+        cached = self._cache.get(resource)
+        if cached is not None and cached.body == body:
+            # Repeated push; just mark the cached body as fresh
+            cached.timestamp = time.monotonic()
+            return
+
+        self._store_message(resource, body)
+        _LOGGER.debug("Cached message for resource: %s", resource)
+        self.async_set_updated_data(self._cache)
+
+    def _store_message(self, resource: str, body: Any) -> None:
+        """Cache a message body."""
+        self._cache[resource] = CachedMessage(
+            resource=resource,
+            body=body,
+            timestamp=time.monotonic(),
+        )
 
     def _convert_to_dict(self, obj: Any) -> dict[str, Any]:
         """Convert pybose response objects to dict."""
+        # pybose responses are plain dicts; check the common cases first
         if isinstance(obj, dict):
             return obj
-        try:
+        if isinstance(obj, Mapping):
             return dict(obj)
-        except (TypeError, ValueError):
-            if hasattr(obj, "__dict__"):
-                return obj.__dict__
-            return {"value": obj}
+        to_dict = getattr(type(obj), "to_dict", None)
+        if to_dict is not None:
+            return to_dict(obj)
+        obj_dict = getattr(obj, "__dict__", None)
+        if obj_dict is not None:
+            return obj_dict
+        return {"value": obj}
 
     def _is_cache_valid(self, resource: str) -> bool:
         """Check if cached data for a resource is still valid."""
-        if resource not in self.data.cached_messages:
+        if resource not in self._cache:
             return False
 
-        cached = self.data.cached_messages[resource]
-        age = (datetime.now() - cached.timestamp).total_seconds()
-        return age < CACHE_EXPIRY_SECONDS
+        cached = self._cache[resource]
+        return time.monotonic() - cached.timestamp < CACHE_EXPIRY_SECONDS
 
     def get_cached_data(self, resource: str) -> dict[str, Any] | None:
         """Get cached data if available and valid."""
         if self._is_cache_valid(resource):
             _LOGGER.debug("Returning cached data for resource: %s", resource)
-            return self.data.cached_messages[resource].body
+            return self._cache[resource].body
         return None
 
-    async def get_audio_volume(self) -> dict[str, Any]:
-        """Get audio volume with caching."""
-        resource = "/audio/volume"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
+    async def _fetch_cached(
+        self,
+        resource: str,
+        fetch: Callable[..., Awaitable[Any]] | None = None,
+        *args: Any,
+    ) -> dict[str, Any]:
+        """Return cached data for a resource, fetching it from the speaker on a miss.
+
+        Expired data is returned as-is while a background task refreshes it.
+        """
+        if fetch is None:
+            fetch = self._fetchers[resource]
+
+        cached = self._cache.get(resource)
+        if cached is None:
+            return await self._fetch_first(resource, fetch, *args)
+
+        if (
+            time.monotonic() - cached.timestamp >= CACHE_EXPIRY_SECONDS
+            and resource not in self._in_flight
+        ):
+            task = self.hass.async_create_background_task(
+                self._refresh(resource, fetch, *args),
+                f"{self.name} refresh {resource}",
+            )
+            if not task.done():
+                self._in_flight[resource] = task
+        return cached.body
 
-        _LOGGER.debug("Fetching fresh audio volume data")
-        result = await self.speaker.get_audio_volume()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
+    async def _fetch_fresh(
+        self,
+        resource: str,
+        fetch: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> dict[str, Any]:
+        """Fetch a resource from the speaker and cache the result."""
+        _LOGGER.debug("Fetching fresh data for resource: %s", resource)
+        result_dict = self._convert_to_dict(await fetch(*args))
+        self._store_message(resource, result_dict)
         return result_dict
 
+    async def _fetch_first(
+        self,
+        resource: str,
+        fetch: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> dict[str, Any]:
+        """Fetch an uncached resource once for all concurrent callers.
+
+        The fetch runs in its own task, so cancelling one caller doesn't
+        cancel it for the others.
+        """
+        task = self._pending.get(resource)
+        if task is None:
+            task = self.hass.async_create_task(
+                self._fetch_fresh(resource, fetch, *args),
+                f"{self.name} fetch {resource}",
+                eager_start=True,
+            )
+            if not task.done():
+                self._pending[resource] = task
+                task.add_done_callback(
+                    lambda task: self._fetch_first_done(resource, task)
+                )
+        return await asyncio.shield(task)
+
+    def _fetch_first_done(
+        self, resource: str, task: asyncio.Task[dict[str, Any]]
+    ) -> None:
+        """Forget a finished first fetch."""
+        del self._pending[resource]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller was cancelled
+
+    async def _refresh(
+        self,
+        resource: str,
+        fetch: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> None:
+        """Refresh a stale resource in the background."""
+        try:
+            await self._fetch_fresh(resource, fetch, *args)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Background refresh of %s failed: %s", resource, err)
+        finally:
+            self._in_flight.pop(resource, None)
+
+    async def async_prime_cache(self, endpoints: frozenset[str]) -> None:
+        """Fetch all supported resources concurrently to warm the cache."""
+        await asyncio.gather(
+            *(
+                self._fetch_cached(resource)
+                for resource in self._fetchers
+                if resource in endpoints
+            ),
+            return_exceptions=True,
+        )
+
+    async def get_audio_volume(self) -> dict[str, Any]:
+        """Get audio volume with caching."""
+        return await self._fetch_cached(RESOURCE_AUDIO_VOLUME)
+
     async def get_now_playing(self) -> dict[str, Any]:
         """Get now playing with caching."""
-        resource = "/content/nowPlaying"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh now playing data")
-        result = await self.speaker.get_now_playing()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+        return await self._fetch_cached(RESOURCE_NOW_PLAYING)
 
     async def get_battery_status(self) -> dict[str, Any]:
         """Get battery status with caching."""
-        resource = "/system/battery"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh battery status data")
-        result = await self.speaker.get_battery_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+        return await self._fetch_cached(RESOURCE_BATTERY)
 
     async def get_bluetooth_sink_status(self) -> dict[str, Any]:
         """Get Bluetooth sink status with caching."""
-        resource = "/bluetooth/sink/status"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh Bluetooth sink status data")
-        result = await self.speaker.get_bluetooth_sink_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+        return await self._fetch_cached(RESOURCE_BLUETOOTH_SINK_STATUS)
 
     async def get_bluetooth_sink_list(self) -> dict[str, Any]:
         """Get Bluetooth sink list with caching."""
-        resource = "/bluetooth/sink/list"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh Bluetooth sink list data")
-        result = await self.speaker.get_bluetooth_sink_list()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+        return await self._fetch_cached(RESOURCE_BLUETOOTH_SINK_LIST)
 
     async def get_bluetooth_source_status(self) -> dict[str, Any]:
         """Get Bluetooth source status with caching."""
-        resource = "/bluetooth/source/status"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh Bluetooth source status data")
-        result = await self.speaker.get_bluetooth_source_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+        return await self._fetch_cached(RESOURCE_BLUETOOTH_SOURCE_STATUS)
 
     async def get_wifi_status(self) -> dict[str, Any]:
         """Get WiFi status with caching."""
-        resource = "/network/wifi/status"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh WiFi status data")
-        result = await self.speaker.get_wifi_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+        return await self._fetch_cached(RESOURCE_WIFI_STATUS)
 
     async def get_network_status(self) -> dict[str, Any]:
         """Get network status with caching."""
-        resource = "/network/status"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh network status data")
-        result = await self.speaker.get_network_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+        return await self._fetch_cached(RESOURCE_NETWORK_STATUS)
 
     async def get_active_groups(self) -> list[dict[str, Any]]:
         """Get active groups with caching."""
-        resource = "/grouping/activeGroups"
+        resource = RESOURCE_ACTIVE_GROUPS
         cached = self.get_cached_data(resource)
         if cached is not None:
             return cached.get("activeGroups", [])
 
         _LOGGER.debug("Fetching fresh active groups data")
         result = await self.speaker.get_active_groups()
-        result_list = [self._convert_to_dict(item) for item in result]
-        self._cache_message(
-            {
-                "header": {"resource": resource},
-                "body": {"activeGroups": result_list},
-            }
-        )
+        convert = self._convert_to_dict
+        result_list = [
+            item if isinstance(item, dict) else convert(item) for item in result
+        ]
+        self._store_message(resource, {"activeGroups": result_list})
         return result_list
 
     async def get_sources(self) -> dict[str, Any]:
@@ -239,18 +341,30 @@ class BoseCoordinator(DataUpdateCoordinator[BoseCoordinatorData]):
 
     async def get_audio_setting(self, option: str) -> dict[str, Any]:
         """Get audio setting with caching."""
-        resource = f"/audio/{option}"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
+        resource = _AUDIO_RESOURCES.get(option) or f"/audio/{option}"
+        return await self._fetch_cached(
+            resource, self.speaker.get_audio_setting, option
+        )
 
-        _LOGGER.debug("Fetching fresh audio setting data for %s", option)
-        result = await self.speaker.get_audio_setting(option)
-        result_dict = dict(result) if hasattr(result, "__iter__") else {"value": result}
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+    async def get_all_audio_settings(
+        self, options: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Get several audio settings concurrently, keyed by option.
+
+        Options that fail to fetch are left out of the result.
+        """
+        results = await asyncio.gather(
+            *(self.get_audio_setting(option) for option in options),
+            return_exceptions=True,
+        )
+        settings: dict[str, dict[str, Any]] = {}
+        for option, result in zip(options, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.debug("Failed to fetch audio setting %s: %s", option, result)
+            else:
+                settings[option] = result
+        return settings
 
-    async def _async_update_data(self) -> BoseCoordinatorData:
-        """Fetch data from speaker."""
-        self.data.last_update = datetime.now()
-        return self.data
+    async def _async_update_data(self) -> dict[str, CachedMessage]:
+        """Return the cached speaker data; updates arrive by push."""
+        return self._cache
@@ -1,6 +1,7 @@
 """Base entity for Bose integration."""
 
-from typing import cast
+from string import ascii_lowercase, ascii_uppercase
+from typing import Any, cast
 
 from propcache.api import cached_property
 from pybose.BoseSpeaker import BoseSpeaker
@@ -8,54 +9,72 @@ from pybose.BoseSpeaker import BoseSpeaker
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 
+from .bose.dispatcher import BoseDispatcher
 from .const import DOMAIN
 
+# Lowercases ASCII and turns spaces into underscores in a single pass
+_UNIQUE_ID_TABLE = str.maketrans(" " + ascii_uppercase, "_" + ascii_lowercase)
+
 
 class BoseBaseEntity(Entity):
     """Base entity for Bose integration."""
 
     _cf_unique_id: str | None = None
+    # Set by entities that receive pushed messages for a resource through
+    # _parse_message; subscribed only while the entity is added
+    _dispatcher: BoseDispatcher | None = None
+    _message_resource: str | None = None
 
     def __init__(self, speaker: BoseSpeaker) -> None:
         """Initialize the entity."""
         self.speaker = speaker
+        self._device_id = cast(str, speaker.get_device_id())
 
         self._attr_has_entity_name = True
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to pushed messages once the entity is added."""
+        await super().async_added_to_hass()
+        if self._dispatcher is not None and self._message_resource is not None:
+            self.async_on_remove(
+                self._dispatcher.subscribe(
+                    self._message_resource,
+                    self._parse_message,  # type: ignore[attr-defined]
+                )
+            )
+
+    def _pushed_state(self) -> tuple[Any, ...]:
+        """Return the attributes a pushed speaker message can change."""
+        return (
+            getattr(self, "_attr_native_value", None),
+            getattr(self, "_attr_is_on", None),
+            self._attr_available,
+        )
+
     @cached_property
     def device_info(self) -> DeviceInfo:
         """Return the device info of the entity."""
         return DeviceInfo(
-            identifiers={(DOMAIN, cast(str, self.speaker.get_device_id()))},
+            identifiers={(DOMAIN, self._device_id)},
         )
 
     @cached_property
     def unique_id(self) -> str:
         """Return a unique ID for this entity."""
-        base_id = cast(str, self.speaker.get_device_id())
-
-        if (
-            hasattr(self, "_cf_unique_id")
-            and self._cf_unique_id is not None
-            and self._cf_unique_id.strip()
-        ):
-            name_part = self._cf_unique_id.strip()
-        elif (
-            hasattr(self, "_attr_translation_key")
-            and self._attr_translation_key is not None
-            and self._attr_translation_key.strip()
+        # Subclasses set these after BoseBaseEntity.__init__, so this can't
+        # be computed eagerly there
+        for name_part in (
+            self._cf_unique_id,
+            self._attr_translation_key,
+            getattr(self, "_attr_name", None),
         ):
-            name_part = self._attr_translation_key.strip()
-        elif (
-            hasattr(self, "_attr_name")
-            and self._attr_name is not None
-            and self._attr_name.strip()
-        ):
-            name_part = self._attr_name.strip()
+            if name_part and (name_part := name_part.strip()):
+                break
         else:
             name_part = "error"
 
-        if not name_part:
-            return base_id
-        name_part = name_part.lower().replace(" ", "_")
-        return f"{base_id}_{name_part}"
+        if name_part.isascii():
+            name_part = name_part.translate(_UNIQUE_ID_TABLE)
+        else:
+            name_part = name_part.lower().replace(" ", "_")
+        return f"{self._device_id}_{name_part}"
@@ -1,7 +1,12 @@
 """Support for Bose media player."""
 
 import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+import logging
 from typing import Any
+from weakref import WeakValueDictionary
 
 from pybose.BoseResponse import (
     AudioVolume,
@@ -13,8 +18,8 @@ from pybose.BoseResponse import (
 )
 from pybose.BoseSpeaker import BoseSpeaker
 import pychromecast
-from pychromecast import discovery
 from pychromecast.discovery import CastBrowser, SimpleCastListener
+from pychromecast.models import CastInfo
 
 from homeassistant.components import media_source, zeroconf
 from homeassistant.components.media_player import (
@@ -26,16 +31,144 @@ from homeassistant.components.media_player import (
     async_process_play_media_url,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 import homeassistant.helpers.entity_registry as er
 from homeassistant.util import dt as dt_util
 
-from .const import _LOGGER, CONF_CHROMECAST_AUTO_ENABLE, DOMAIN
+from .const import CONF_CHROMECAST_AUTO_ENABLE, DOMAIN
 from .coordinator import BoseCoordinator
 from .entity import BoseBaseEntity
 
+_LOGGER = logging.getLogger(__name__)
+
+# Turns a source name into the form used in option keys (see config_flow)
+_SLUG_TABLE = str.maketrans({" ": "_", ":": "_"})
+
+# Chromecast content types by media URL extension
+_CONTENT_TYPES = {
+    "mp3": "audio/mpeg",
+    "wav": "audio/mpeg",
+    "flac": "audio/mpeg",
+    "m4a": "audio/mpeg",
+    "aac": "audio/mpeg",
+    "mp4": "video/mp4",
+    "avi": "video/mp4",
+    "mkv": "video/mp4",
+    "webm": "video/mp4",
+    "m3u8": "application/x-mpegURL",
+    "pls": "audio/x-scpls",
+}
+
+# Streaming sources, matched by account ID rather than source account
+_STREAMING_SOURCES = frozenset({"SPOTIFY", "AMAZON", "DEEZER"})
+# Generic account names that don't name a user's streaming account
+_STREAMING_DEFAULT_ACCOUNTS = frozenset(
+    {"AlexaUserName", "SpotifyConnectUserName", "DeezerUserName"}
+)
+
+# Waits (seconds) for the cast device to appear after enabling Chromecast
+_CAST_ENABLE_BACKOFF = (0.3, 0.7, 1.5, 3.0)
+
+
+# Media classes shown when browsing, besides audio content types
+_AUDIO_MEDIA_CLASSES = frozenset({"music", "podcast", "audiobook"})
+
+
+def _is_playable_audio(item: BrowseMedia) -> bool:
+    """Filter to only show audio content that the speaker can likely play."""
+    return (
+        item.media_class in _AUDIO_MEDIA_CLASSES
+        or item.media_content_type == MediaType.MUSIC
+        or item.media_content_type.startswith("audio/")
+    )
+
+
+class _CastDiscovery:
+    """Chromecast browser shared by all Bose speakers, kept running."""
+
+    def __init__(self, hass: HomeAssistant, zc: Any) -> None:
+        """Initialize; the browser is attached by _async_get_cast_discovery."""
+        self.hass = hass
+        self.zeroconf = zc
+        self.browser: CastBrowser | None = None
+        # Connecting blocks until the device answers; keep that off the
+        # shared default executor
+        self.executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="bose_cast"
+        )
+        self._waiters: dict[str, asyncio.Event] = {}
+        # Connected Chromecasts by host; entries go away with their last user
+        self.chromecasts: WeakValueDictionary[
+            str, pychromecast.Chromecast
+        ] = WeakValueDictionary()
+
+    def cast_changed(self, uuid, service) -> None:
+        """Wake up waiters for the host of a discovered device (zeroconf thread)."""
+        device = self.browser.devices.get(uuid) if self.browser else None
+        if device is not None:
+            self.hass.loop.call_soon_threadsafe(self._notify, device.host)
+
+    def _notify(self, host: str) -> None:
+        event = self._waiters.pop(host, None)
+        if event is not None:
+            event.set()
+
+    def get(self, host: str) -> CastInfo | None:
+        """Return the discovered cast device on a host, if any."""
+        if self.browser is None:
+            return None
+        for device in list(self.browser.devices.values()):
+            if device.host == host:
+                return device
+        return None
+
+    async def async_wait(self, host: str, timeout: float) -> CastInfo | None:
+        """Return the cast device on a host, waiting up to timeout for it."""
+        device = self.get(host)
+        if device is None:
+            event = self._waiters.setdefault(host, asyncio.Event())
+            with suppress(TimeoutError):
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+            device = self.get(host)
+        return device
+
+    async def async_run(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking Chromecast call on the cast executor."""
+        return await self.hass.loop.run_in_executor(self.executor, target, *args)
+
+    async def async_stop(self, event: Event | None = None) -> None:
+        """Stop the browser and the cast executor."""
+        if self.browser is not None:
+            await self.hass.async_add_executor_job(self.browser.stop_discovery)
+        self.executor.shutdown(wait=False)
+
+
+async def _async_get_cast_discovery(hass: HomeAssistant) -> _CastDiscovery:
+    """Return the shared Chromecast browser, starting it on first use."""
+    domain_data = hass.data[DOMAIN]
+    async with domain_data.setdefault("_cast_lock", asyncio.Lock()):
+        cast_discovery: _CastDiscovery | None = domain_data.get("_cast_discovery")
+        if cast_discovery is None:
+            # Use Home Assistant's shared Zeroconf instance
+            zc = await zeroconf.async_get_instance(hass)
+            cast_discovery = _CastDiscovery(hass, zc)
+            listener = SimpleCastListener(
+                cast_discovery.cast_changed,
+                update_callback=cast_discovery.cast_changed,
+            )
+            cast_discovery.browser = await hass.async_add_executor_job(
+                CastBrowser, listener, zc
+            )
+            await hass.async_add_executor_job(cast_discovery.browser.start_discovery)
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, cast_discovery.async_stop
+            )
+            domain_data["_cast_discovery"] = cast_discovery
+    return cast_discovery
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -56,6 +189,23 @@ async def async_setup_entry(
 class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
     """Representation of a Bose speaker as a media player."""
 
+    # nowPlaying status -> media player state (STOPPED depends on power)
+    _STATUS_MAP: dict[str, MediaPlayerState] = {
+        "PLAY": MediaPlayerState.PLAYING,
+        "PAUSED": MediaPlayerState.PAUSED,
+        "BUFFERING": MediaPlayerState.BUFFERING,
+    }
+
+    # Pushed resource -> parser method for its body
+    _RESOURCE_HANDLERS: dict[str, str] = {
+        "/audio/volume": "_parse_audio_volume",
+        "/content/nowPlaying": "_parse_now_playing",
+        "/grouping/activeGroups": "_parse_grouping",
+        "/bluetooth/sink/list": "_parse_bluetooth_sink_list",
+        "/bluetooth/sink/status": "_parse_bluetooth_sink_status",
+        "/bluetooth/source/status": "_parse_bluetooth_source_status",
+    }
+
     def __init__(
         self,
         speaker: BoseSpeaker,
@@ -69,7 +219,6 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         self.speaker = speaker
         self.coordinator = coordinator
         self.hass = hass
-        self._device_id = speaker.get_device_id()
         self._is_on = False
         self._attr_state = MediaPlayerState.OFF
         self._attr_volume_level = 0.5
@@ -83,8 +232,18 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         self._attr_media_position = None
         self._attr_media_position_updated_at = None
         self._now_playing_result = ContentNowPlaying({})
+        self._now_state: dict[str, Any] = {}
+        # supported_features and the inputs it was computed from
+        self._features: MediaPlayerEntityFeature | None = None
+        self._features_now: Any = None
+        self._features_cast = False
+        # Inputs the last parsed nowPlaying result was resolved with
+        self._parsed_is_on = False
+        self._parsed_source_index: dict | None = None
         self._attr_group_members = []
         self._attr_source_list: list[str] = []
+        self._renamed_source_list: list[str] = []
+        self._source_list_with_cast: list[str] = ["Chromecast built-in"]
         self._active_group_id = None
         self._attr_translation_key = "media_player"
         self._cf_unique_id = system_info["name"]
@@ -93,13 +252,18 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             "Cinch": {"source": "PRODUCT", "sourceAccount": "AUX_ANALOG"},
             "TV": {"source": "PRODUCT", "sourceAccount": "TV"},
         }
+        self._source_index: dict[tuple[str | None, str | None], str] = {}
+        self._rebuild_source_index()
         self._bluetooth_devices: dict[str, dict] = {}
+        self._bluetooth_sources: set[str] = set()
         self._chromecast_device = None
         self._media_controller = None
         self._speaker_ip = config_entry.data.get("ip")
         self._linked_media_players: dict[str, str] = {}
         self._source_renames: dict[str, str] = {}
         self._config_entry = config_entry
+        self._last_fingerprint: tuple | None = None
+        self._update_task: asyncio.Task[None] | None = None
 
         speaker.attach_receiver(self.parse_message)
 
@@ -117,6 +281,9 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             config_entry.add_update_listener(self._async_options_updated)
         )
 
+        self._tracked_linked_entities: frozenset[str] = frozenset()
+        self._unsub_linked: CALLBACK_TYPE | None = None
+        config_entry.async_on_unload(self._async_unsub_linked_players)
         self._setup_linked_player_listeners()
 
     def _load_linked_media_players(self) -> None:
@@ -125,35 +292,45 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         self._linked_media_players = {}
         self._source_renames = {}
 
-        for key, value in options.items():
-            if key.startswith("rename_") and value:
-                source_name = key.replace("rename_", "").replace("_", " ")
-                for available_source in self._available_sources:
-                    if (
-                        available_source.replace(" ", "_").replace(":", "_").lower()
-                        == source_name.lower()
-                    ):
-                        if value != available_source:
-                            self._source_renames[available_source] = value
-                        break
+        # Option keys carry the source name with spaces and colons as "_"
+        slug_to_source: dict[str, str] = {}
+        for available_source in self._available_sources:
+            slug_to_source.setdefault(
+                available_source.translate(_SLUG_TABLE).lower(), available_source
+            )
 
-            elif key.startswith("linked_player_") and value:
-                source_name = key.replace("linked_player_", "").replace("_", " ")
-                for available_source in self._available_sources:
-                    if (
-                        available_source.replace(" ", "_").replace(":", "_").lower()
-                        == source_name.lower()
-                    ):
-                        self._linked_media_players[available_source] = value
-                        break
+        for key, value in options.items():
+            if not value:
+                continue
+            if key.startswith("rename_"):
+                slug = key.removeprefix("rename_").lower()
+                available_source = slug_to_source.get(slug)
+                if available_source is not None and value != available_source:
+                    self._source_renames[available_source] = value
+            elif key.startswith("linked_player_"):
+                slug = key.removeprefix("linked_player_").lower()
+                available_source = slug_to_source.get(slug)
+                if available_source is not None:
+                    self._linked_media_players[available_source] = value
 
         _LOGGER.debug("Loaded linked media players: %s", self._linked_media_players)
         _LOGGER.debug("Loaded source renames: %s", self._source_renames)
+        self._rebuild_source_list()
 
     def _get_source_display_name(self, source: str) -> str:
         """Get display name for a source (renamed if configured, otherwise original)."""
         return self._source_renames.get(source, source)
 
+    def _rebuild_source_list(self) -> None:
+        """Recompute the displayed source list after sources or renames change."""
+        self._renamed_source_list = [
+            self._get_source_display_name(source) for source in self._attr_source_list
+        ]
+        self._source_list_with_cast = [
+            "Chromecast built-in",
+            *self._renamed_source_list,
+        ]
+
     def get_original_sources(self) -> list[str]:
         """Get list of original source names (without renames)."""
         return list(self._attr_source_list)
@@ -166,36 +343,45 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         @callback
         def _linked_player_state_changed(event):
             """Handle state change of linked media player."""
-            entity_id = event.data.get("entity_id")
-            if entity_id in self._linked_media_players.values():
-                for source, linked_entity in self._linked_media_players.items():
-                    if linked_entity == entity_id and self._attr_source == source:
-                        self._update_from_linked_media_player(entity_id)
-                        self.async_write_ha_state()
-                        break
+            entity_id = event.data["entity_id"]
+            if self._linked_media_players.get(self._attr_source) != entity_id:
+                return
+            self._update_from_linked_media_player(entity_id, event.data["new_state"])
+            self._async_write_state_if_changed()
 
-        if self._linked_media_players:
-            self._config_entry.async_on_unload(
-                async_track_state_change_event(
-                    self.hass,
-                    list(self._linked_media_players.values()),
-                    _linked_player_state_changed,
-                )
+        tracked = frozenset(self._linked_media_players.values())
+        if tracked == self._tracked_linked_entities:
+            return
+        self._tracked_linked_entities = tracked
+
+        self._async_unsub_linked_players()
+        if tracked:
+            self._unsub_linked = async_track_state_change_event(
+                self.hass, list(tracked), _linked_player_state_changed
             )
 
+    def _async_unsub_linked_players(self) -> None:
+        """Remove the linked media player state listener, if any."""
+        if self._unsub_linked is not None:
+            self._unsub_linked()
+            self._unsub_linked = None
+
     async def _async_options_updated(
         self, hass: HomeAssistant, config_entry: ConfigEntry
     ) -> None:
         """Handle options update."""
         self._load_linked_media_players()
         self._setup_linked_player_listeners()
+        # async_update writes the state (with the new renames) when it finishes
         await self.async_update()
-        self.async_write_ha_state()
 
-    def _update_from_linked_media_player(self, entity_id: str) -> None:
+    def _update_from_linked_media_player(
+        self, entity_id: str, linked_state: State | None = None
+    ) -> None:
         """Update playback information from a linked media player."""
         try:
-            linked_state = self.hass.states.get(entity_id)
+            if linked_state is None:
+                linked_state = self.hass.states.get(entity_id)
             if linked_state is None:
                 _LOGGER.debug("Linked media player %s not found", entity_id)
                 return
@@ -249,26 +435,18 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
     def parse_message(self, data):
         """Parse the message from the speaker."""
 
-        resource = data.get("header", {}).get("resource")
+        header = data.get("header")
+        resource = header.get("resource") if header is not None else None
         body = data.get("body", {})
-        if resource == "/audio/volume":
-            self._parse_audio_volume(AudioVolume(body))
+        handler = self._RESOURCE_HANDLERS.get(resource)
+        if handler is not None:
+            getattr(self, handler)(body)
         elif resource == "/system/power/control":
             self._is_on = body.get("power") == "ON"
             if not self._is_on:
                 self._attr_state = MediaPlayerState.OFF
-        elif resource == "/content/nowPlaying":
-            self._parse_now_playing(ContentNowPlaying(body))
-        elif resource == "/grouping/activeGroups":
-            self._parse_grouping(body)
-        elif resource == "/bluetooth/sink/list":
-            self._parse_bluetooth_sink_list(BluetoothSinkList(body))
-        elif resource == "/bluetooth/sink/status":
-            self._parse_bluetooth_sink_status(BluetoothSinkStatus(body))
-        elif resource == "/bluetooth/source/status":
-            self._parse_bluetooth_source_status(BluetoothSourceStatus(body))
-
-        self.async_write_ha_state()
+
+        self._async_write_state_if_changed()
 
     def _parse_grouping(self, data: dict):
         active_groups = data.get("activeGroups", {})
@@ -289,94 +467,92 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             self._active_group_id = None
             return
 
-        guids.sort(
-            key=lambda guid: guid == active_group.get("groupMasterId"), reverse=True
-        )
-
-        entity_ids = [
-            self.hass.data[DOMAIN]["media_entities"][guid].entity_id for guid in guids
-        ]
+        # The group master is listed first
+        master = active_group.get("groupMasterId")
+        if master in guids:
+            guids.remove(master)
+            guids.insert(0, master)
 
-        self._attr_group_members = entity_ids
+        media_entities = self.hass.data[DOMAIN]["media_entities"]
+        self._attr_group_members = [media_entities[guid].entity_id for guid in guids]
         self._active_group_id = active_group.get("activeGroupId")
 
     def _parse_audio_volume(self, data: AudioVolume):
         self._attr_volume_level = data.get("value", 0) / 100
         self._attr_is_volume_muted = data.get("muted")
 
-    def _parse_now_playing(self, data: ContentNowPlaying):
-        try:
-            status = data.get("state", {}).get("status")
-            match status:
-                case "PLAY":
-                    self._attr_state = MediaPlayerState.PLAYING
-                case "PAUSED":
-                    self._attr_state = MediaPlayerState.PAUSED
-                case "BUFFERING":
-                    self._attr_state = MediaPlayerState.BUFFERING
-                case "STOPPED" | None:
-                    if self._is_on:
-                        self._attr_state = MediaPlayerState.IDLE
-                    else:
-                        self._attr_state = MediaPlayerState.OFF
-                case _:
-                    _LOGGER.warning("State not implemented: %s", status)
-                    self._attr_state = MediaPlayerState.ON
-        except AttributeError:
+    def _parse_now_playing(
+        self, data: ContentNowPlaying, fetch_bluetooth_source: bool = True
+    ):
+        # Skip repeated payloads unless something else the result depends on
+        # changed; linked players are always re-read
+        if (
+            self._is_on == self._parsed_is_on
+            and self._source_index is self._parsed_source_index
+            and self._attr_source not in self._linked_media_players
+            and data == self._now_playing_result
+        ):
+            return
+        self._parsed_is_on = self._is_on
+        self._parsed_source_index = self._source_index
+
+        state = data.get("state", {})
+        if not isinstance(state, dict):
+            self._attr_state = MediaPlayerState.ON
+        elif (status := state.get("status")) in self._STATUS_MAP:
+            self._attr_state = self._STATUS_MAP[status]
+        elif status in ("STOPPED", None):
+            self._attr_state = (
+                MediaPlayerState.IDLE if self._is_on else MediaPlayerState.OFF
+            )
+        else:
+            _LOGGER.warning("State not implemented: %s", status)
             self._attr_state = MediaPlayerState.ON
 
         self._now_playing_result: ContentNowPlaying = data
-        self._attr_source = data.get("source", {}).get("sourceDisplayName", None)
+        self._now_state = self._extract_state(data)
+        source_dict = data.get("source") or {}
+        self._attr_source = source_dict.get("sourceDisplayName", None)
 
         if self._attr_source == "Chromecast Built-in":
             return
 
+        content_item = (data.get("container") or {}).get("contentItem") or {}
+        content_source = content_item.get("source")
+        content_account = content_item.get("sourceAccount")
+
         # Handle special case for TV source (needs to be determined before linked player check)
-        if (
-            data.get("container", {}).get("contentItem", {}).get("source") == "PRODUCT"
-            and data.get("container", {}).get("contentItem", {}).get("sourceAccount")
-            == "TV"
-        ):
+        if content_source == "PRODUCT" and content_account == "TV":
             self._attr_source = "TV"
 
-        if data.get("source", {}).get("sourceID") == "BLUETOOTH":
+        if source_dict.get("sourceID") == "BLUETOOTH":
             # Fetch active Bluetooth device asynchronously to avoid using await in sync parser
-            if getattr(self, "hass", None) is not None:
+            if fetch_bluetooth_source and getattr(self, "hass", None) is not None:
                 self.hass.async_create_task(
                     self._async_update_active_bluetooth_source()
                 )
         else:
-            for name, source_data in self._available_sources.items():
-                if data.get("container", {}).get("contentItem", {}).get(
-                    "source"
-                ) == source_data.get("source"):
-                    if source_data.get("source") in ("SPOTIFY", "AMAZON", "DEEZER"):
-                        if data.get("container", {}).get("contentItem", {}).get(
-                            "sourceAccount"
-                        ) != source_data.get("accountId"):
-                            continue
-                    elif source_data.get("sourceAccount") != data.get(
-                        "container", {}
-                    ).get("contentItem", {}).get("sourceAccount"):
-                        continue
-
-                    self._attr_source = name
-                    break
+            matched = self._source_index.get((content_source, content_account))
+            if matched is not None:
+                self._attr_source = matched
 
         linked_entity_id = self._linked_media_players.get(self._attr_source)
         if linked_entity_id:
             self._update_from_linked_media_player(linked_entity_id)
             return
 
-        self._attr_media_title = data.get("metadata", {}).get("trackName")
-        self._attr_media_artist = data.get("metadata", {}).get("artist")
-        self._attr_media_album_name = data.get("metadata", {}).get("album")
-        self._attr_media_duration = int(data.get("metadata", {}).get("duration", 999))
-        self._attr_media_position = int(data.get("state", {}).get("timeIntoTrack", 0))
+        metadata = data.get("metadata") or {}
+        self._attr_media_title = metadata.get("trackName")
+        self._attr_media_artist = metadata.get("artist")
+        self._attr_media_album_name = metadata.get("album")
+        self._attr_media_duration = int(metadata.get("duration", 999))
+        self._attr_media_position = int(
+            (data.get("state") or {}).get("timeIntoTrack", 0)
+        )
         self._attr_media_position_updated_at = dt_util.utcnow()
         self._attr_media_image_url = (
-            data.get("track", {}).get("contentItem", {}).get("containerArt")
-        )
+            (data.get("track") or {}).get("contentItem") or {}
+        ).get("containerArt")
 
         if self._attr_source == "TV":
             self._attr_media_title = "TV"
@@ -386,6 +562,33 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             self._attr_media_position = None
             self._attr_media_image_url = None
 
+    @staticmethod
+    def _extract_state(now: Any) -> dict[str, Any]:
+        """Return the state section of a nowPlaying result, or {} if missing."""
+        if isinstance(now, dict):
+            state = now.get("state")
+        else:
+            state = getattr(now, "state", None)
+            get_fn = getattr(now, "get", None)
+            if not isinstance(state, dict) and callable(get_fn):
+                try:
+                    state = get_fn("state", {})
+                except (AttributeError, TypeError):
+                    state = None
+        return state if isinstance(state, dict) else {}
+
+    def _rebuild_source_index(self) -> None:
+        """Index available sources by the nowPlaying (source, account) pair."""
+        index: dict[tuple[str | None, str | None], str] = {}
+        for name, source_data in self._available_sources.items():
+            source = source_data.get("source")
+            # Streaming sources report their account ID as the sourceAccount
+            account = source_data.get(
+                "accountId" if source in _STREAMING_SOURCES else "sourceAccount"
+            )
+            index.setdefault((source, account), name)
+        self._source_index = index
+
     def _parse_bluetooth_sink_list(self, data: BluetoothSinkList) -> None:
         """Parse Bluetooth sink list."""
         devices = data.get("devices", [])
@@ -445,18 +648,23 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
 
     def _update_bluetooth_source_list(self) -> None:
         """Update the source list with Bluetooth devices."""
-        # Remove old Bluetooth sources
+        # Ordered and de-duplicated, in device order
+        bluetooth_sources = dict.fromkeys(
+            f"Bluetooth: {device['name']}"
+            for device in self._bluetooth_devices.values()
+        )
+        if bluetooth_sources.keys() == self._bluetooth_sources:
+            return
+        self._bluetooth_sources = set(bluetooth_sources)
+
+        # Replace the old Bluetooth sources
         self._attr_source_list = [  # pyright: ignore[reportIncompatibleVariableOverride]
             source
             for source in self._attr_source_list
             if not source.startswith("Bluetooth:")
         ]
-
-        # Add Bluetooth devices to source list
-        for device in self._bluetooth_devices.values():
-            bluetooth_source = f"Bluetooth: {device['name']}"
-            if bluetooth_source not in self._attr_source_list:
-                self._attr_source_list.append(bluetooth_source)
+        self._attr_source_list.extend(bluetooth_sources)
+        self._rebuild_source_list()
 
     async def _async_update_active_bluetooth_source(self) -> None:
         """Async helper to fetch active Bluetooth device and update source."""
@@ -483,43 +691,68 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         if active_device and active_device in self._bluetooth_devices:
             bluetooth_device = self._bluetooth_devices[active_device]
             self._attr_source = f"Bluetooth: {bluetooth_device['name']}"
-            self.async_write_ha_state()
-            self._attr_source_list.append(self._attr_source)
+            self._async_write_state_if_changed()
 
     async def async_update(self) -> None:
         """Fetch new state data from the speaker."""
-        data_dict = await self.coordinator.get_now_playing()
-        data = ContentNowPlaying(data_dict)
-        self._parse_now_playing(data)
-
-        volume_dict = await self.coordinator.get_audio_volume()
-        volume_data = AudioVolume(volume_dict)
-        self._parse_audio_volume(volume_data)
-
-        # Refresh Bluetooth information
-        try:
-            bluetooth_sink_status_dict = (
-                await self.coordinator.get_bluetooth_sink_status()
+        # Overlapping callers (initial update, polling, options updates)
+        # share one run instead of fetching and parsing twice
+        if self._update_task is None or self._update_task.done():
+            self._update_task = self.hass.async_create_task(
+                self._async_update(), "Bose media player update"
             )
-            bluetooth_sink_status = BluetoothSinkStatus(bluetooth_sink_status_dict)
-            self._parse_bluetooth_sink_status(bluetooth_sink_status)
-
-            bluetooth_sink_list_dict = await self.coordinator.get_bluetooth_sink_list()
-            bluetooth_sink_list = BluetoothSinkList(bluetooth_sink_list_dict)
-            self._parse_bluetooth_sink_list(bluetooth_sink_list)
+        await asyncio.shield(self._update_task)
+
+    async def _async_update(self) -> None:
+        """Fetch and parse the speaker state for async_update."""
+        coordinator = self.coordinator
+        (
+            data_dict,
+            volume_dict,
+            sources,
+            active_groups,
+            bluetooth_sink_status_dict,
+            bluetooth_sink_list_dict,
+            bluetooth_source_status_dict,
+        ) = await asyncio.gather(
+            coordinator.get_now_playing(),
+            coordinator.get_audio_volume(),
+            coordinator.get_sources(),
+            coordinator.get_active_groups(),
+            coordinator.get_bluetooth_sink_status(),
+            coordinator.get_bluetooth_sink_list(),
+            coordinator.get_bluetooth_source_status(),
+            return_exceptions=True,
+        )
+        for result in (data_dict, volume_dict, sources, active_groups):
+            if isinstance(result, BaseException):
+                raise result
+
+        # The sink status parsed below already sets the active Bluetooth source
+        self._parse_now_playing(
+            data_dict,
+            fetch_bluetooth_source=isinstance(
+                bluetooth_sink_status_dict, BaseException
+            ),
+        )
+        self._parse_audio_volume(volume_dict)
 
-            bluetooth_source_status_dict = (
-                await self.coordinator.get_bluetooth_source_status()
-            )
-            bluetooth_source_status = BluetoothSourceStatus(
-                bluetooth_source_status_dict
-            )
-            self._parse_bluetooth_source_status(bluetooth_source_status)
-        except (ConnectionError, TimeoutError) as err:
-            _LOGGER.debug("Failed to get Bluetooth information: %s", err)
+        # Refresh Bluetooth information
+        for result, parser in (
+            (bluetooth_sink_status_dict, self._parse_bluetooth_sink_status),
+            (bluetooth_sink_list_dict, self._parse_bluetooth_sink_list),
+            (bluetooth_source_status_dict, self._parse_bluetooth_source_status),
+        ):
+            if isinstance(result, ConnectionError | TimeoutError):
+                _LOGGER.debug("Failed to get Bluetooth information: %s", result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                parser(result)
 
         # Refresh available sources (build human readable list)
-        sources = await self.coordinator.get_sources()
+        sources_changed = False
+        source_list_changed = False
         for source in sources.get("sources", []):
             if (
                 (
@@ -529,14 +762,10 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                 and source.get("sourceAccountName", None)
                 and source.get("sourceName", None)
             ):
-                if source.get("sourceName", None) in (
-                    "AMAZON",
-                    "SPOTIFY",
-                    "DEEZER",
-                ) and source.get("sourceAccountName", None) not in (
-                    "AlexaUserName",
-                    "SpotifyConnectUserName",
-                    "DeezerUserName",
+                if (
+                    source.get("sourceName", None) in _STREAMING_SOURCES
+                    and source.get("sourceAccountName", None)
+                    not in _STREAMING_DEFAULT_ACCOUNTS
                 ):
                     display = f"{source.get('sourceName', None).capitalize()}: {source.get('sourceAccountName', None)}"
                     self._available_sources[display] = {
@@ -544,6 +773,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                         "sourceAccount": source.get("sourceAccountName", None),
                         "accountId": source.get("accountId", None),
                     }
+                    sources_changed = True
 
                 for key, value in self._available_sources.items():
                     if (
@@ -553,16 +783,20 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                     ):
                         if key not in self._attr_source_list:
                             self._attr_source_list.append(key)
+                            source_list_changed = True
+
+        if sources_changed:
+            self._rebuild_source_index()
+        if source_list_changed:
+            self._rebuild_source_list()
 
-        active_groups = await self.coordinator.get_active_groups()
         self._parse_grouping({"activeGroups": active_groups})
 
-        if self._has_linked_media_player():
-            linked_entity_id = self._linked_media_players.get(self._attr_source)
-            if linked_entity_id:
-                self._update_from_linked_media_player(linked_entity_id)
+        linked_entity_id = self._linked_media_players.get(self._attr_source)
+        if linked_entity_id:
+            self._update_from_linked_media_player(linked_entity_id)
 
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_select_source(self, source: str) -> None:
         """Select an input source on the speaker."""
@@ -581,7 +815,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                     try:
                         await self.speaker.connect_bluetooth_sink_device(device["mac"])
                         self._attr_source = original_source
-                        self.async_write_ha_state()
+                        self._async_write_state_if_changed()
                     except (ConnectionError, TimeoutError) as err:
                         raise ServiceValidationError(
                             translation_domain=DOMAIN,
@@ -614,39 +848,39 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         result = await self.speaker.set_source(
             source_data.get("source", ""), source_data.get("sourceAccount", "")
         )
-        self._parse_now_playing(ContentNowPlaying(result))
+        self._parse_now_playing(result)
 
     async def async_turn_on(self) -> None:
         """Turn on the speaker."""
         await self.speaker.set_power_state(True)
         self._is_on = True
         self._attr_state = MediaPlayerState.IDLE
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_turn_off(self) -> None:
         """Turn off the speaker."""
         await self.speaker.set_power_state(False)
         self._is_on = False
         self._attr_state = MediaPlayerState.OFF
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_media_stop(self) -> None:
         """Stop the playback."""
         await self.speaker.pause()
         self._attr_state = MediaPlayerState.IDLE
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level (0.0 to 1.0)."""
         await self.speaker.set_audio_volume(int(volume * 100))
         self._attr_volume_level = volume
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Send mute command."""
         await self.speaker.set_audio_volume_muted(mute)
         self._attr_is_volume_muted = mute
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_media_play(self) -> None:
         """Play the current media."""
@@ -662,7 +896,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
 
         await self.speaker.play()
         self._attr_state = MediaPlayerState.PLAYING
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_media_pause(self) -> None:
         """Pause the current media."""
@@ -678,7 +912,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
 
         await self.speaker.pause()
         self._attr_state = MediaPlayerState.PAUSED
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_media_next_track(self) -> None:
         """Skip to the next track."""
@@ -693,7 +927,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             return
 
         await self.speaker.skip_next()
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_media_previous_track(self) -> None:
         """Skip to the previous track."""
@@ -708,7 +942,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             return
 
         await self.speaker.skip_previous()
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_media_seek(self, position: float) -> None:
         """Seek the media to a specific location."""
@@ -723,7 +957,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             return
 
         await self.speaker.seek(position)
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_play_media(
         self, media_type: MediaType | str, media_id: str, **kwargs: Any
@@ -744,7 +978,8 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         )
 
         try:
-            if self._chromecast_device is None or self._media_controller is None:
+            if not self._cast_healthy():
+                await self._async_reset_chromecast()
                 await self._async_setup_chromecast()
 
             # Check if Chromecast device is available
@@ -765,7 +1000,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             )
             self._attr_source = "Chromecast built-in"
             self._attr_state = MediaPlayerState.PLAYING
-            self.async_write_ha_state()
+            self._async_write_state_if_changed()
 
             _LOGGER.info("Successfully started Chromecast playback for %s", media_id)
 
@@ -780,7 +1015,29 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                 },
             ) from err
 
-    async def _async_setup_chromecast(self, secondTry=False) -> None:
+    def _cast_healthy(self) -> bool:
+        """Return True if the cached Chromecast connection is usable."""
+        return (
+            self._chromecast_device is not None
+            and self._media_controller is not None
+            and self._chromecast_device.socket_client.is_connected
+        )
+
+    async def _async_reset_chromecast(self) -> None:
+        """Disconnect and drop the cached Chromecast."""
+        if self._chromecast_device is None:
+            return
+        _LOGGER.debug("Dropping Chromecast connection to %s", self._speaker_ip)
+        await self.hass.async_add_executor_job(self._chromecast_device.disconnect, 0)
+        self._chromecast_device = None
+        self._media_controller = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Release the Chromecast connection when the entity is removed."""
+        await super().async_will_remove_from_hass()
+        await self._async_reset_chromecast()
+
+    async def _async_setup_chromecast(self) -> None:
         """Set up Chromecast device for media playback."""
         if self._speaker_ip is None:
             _LOGGER.warning("No speaker IP available for Chromecast setup")
@@ -789,80 +1046,62 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         try:
             _LOGGER.debug("Discovering Chromecast on %s", self._speaker_ip)
 
-            # Get Home Assistant's shared Zeroconf instance
-            zc = await zeroconf.async_get_instance(self.hass)
-
-            # Create a simple cast listener to handle discovered devices
-            def cast_listener(uuid, service):
-                """Handle discovered cast device."""
-                if uuid in browser.devices:
-                    device = browser.devices[uuid]
-                    if device.host == self._speaker_ip:
-                        _LOGGER.debug(
-                            "Found matching Chromecast device: %s", device.friendly_name
-                        )
-
-            # Create browser and start discovery using shared Zeroconf instance
-            browser = await self.hass.async_add_executor_job(
-                CastBrowser, SimpleCastListener(cast_listener), zc
-            )
+            cast_discovery = await _async_get_cast_discovery(self.hass)
 
-            await self.hass.async_add_executor_job(browser.start_discovery)
+            # Reuse a live connection to the same host if one is still around
+            chromecast = cast_discovery.chromecasts.get(self._speaker_ip)
+            if chromecast is not None and chromecast.socket_client.is_connected:
+                self._chromecast_device = chromecast
+                self._media_controller = chromecast.media_controller
+                return
 
-            # Wait a bit for discovery to find devices
-            await asyncio.sleep(3)
+            # Wait until the speaker's cast device shows up, for at most 3s
+            device = await cast_discovery.async_wait(self._speaker_ip, timeout=3)
 
-            # Look for a Chromecast device on the same IP as our Bose speaker
-            chromecast_found = False
-            for uuid, device in browser.devices.items():
-                if device.host == self._speaker_ip:
-                    # Create chromecast instance
-                    self._chromecast_device = await self.hass.async_add_executor_job(
-                        pychromecast.get_chromecast_from_cast_info, device, zc
-                    )
-                    self._media_controller = self._chromecast_device.media_controller
-                    _LOGGER.info(
-                        "Found Chromecast device at %s: %s",
-                        self._speaker_ip,
-                        device.friendly_name,
+            auto_enable = self._config_entry.options.get(
+                CONF_CHROMECAST_AUTO_ENABLE, True
+            )
+            if device is None and auto_enable:
+                _LOGGER.debug(
+                    "Chromecast device not found for Bose speaker at %s, enabling it",
+                    self._speaker_ip,
+                )
+                await self.speaker.set_chromecast(True)
+                # Give the speaker time to announce its cast service
+                for delay in _CAST_ENABLE_BACKOFF:
+                    device = await cast_discovery.async_wait(
+                        self._speaker_ip, timeout=delay
                     )
-                    chromecast_found = True
-                    break
+                    if device is not None:
+                        break
 
-            if self._chromecast_device:
-                await self.hass.async_add_executor_job(self._chromecast_device.wait)
+            if device is not None:
+                # Create chromecast instance
+                self._chromecast_device = await cast_discovery.async_run(
+                    pychromecast.get_chromecast_from_cast_info,
+                    device,
+                    cast_discovery.zeroconf,
+                )
+                self._media_controller = self._chromecast_device.media_controller
+                _LOGGER.info(
+                    "Found Chromecast device at %s: %s",
+                    self._speaker_ip,
+                    device.friendly_name,
+                )
+                await cast_discovery.async_run(self._chromecast_device.wait)
+                cast_discovery.chromecasts[self._speaker_ip] = self._chromecast_device
                 _LOGGER.debug("Chromecast device connected successfully")
-            elif not chromecast_found:
+            elif not auto_enable:
                 _LOGGER.debug(
-                    "Chromecast device not found for Bose speaker at %s",
-                    self._speaker_ip,
+                    "Chromecast auto-enable is disabled, skipping automatic activation"
                 )
-                auto_enable = self._config_entry.options.get(
-                    CONF_CHROMECAST_AUTO_ENABLE, True
+                _LOGGER.info(
+                    "Chromecast is not enabled on the BOSE speaker. Without Chromecast enabled, media playback / TTS will not work. Either enable Chromecast manually via the Bose app, or enable automatic Chromecast activation in the integration options."
+                )
+            else:
+                _LOGGER.warning(
+                    "No Chromecast device found for Bose speaker after enabling Chromecast"
                 )
-                if not secondTry and auto_enable:
-                    await self.speaker.set_chromecast(True)
-                    # Stop discovery before retrying
-                    await self.hass.async_add_executor_job(
-                        discovery.stop_discovery, browser
-                    )
-                    await self._async_setup_chromecast(True)
-                    return
-
-                if not auto_enable:
-                    _LOGGER.debug(
-                        "Chromecast auto-enable is disabled, skipping automatic activation"
-                    )
-                    _LOGGER.info(
-                        "Chromecast is not enabled on the BOSE speaker. Without Chromecast enabled, media playback / TTS will not work. Either enable Chromecast manually via the Bose app, or enable automatic Chromecast activation in the integration options."
-                    )
-                else:
-                    _LOGGER.warning(
-                        "No Chromecast device found for Bose speaker after enabling Chromecast"
-                    )
-
-            # Stop discovery
-            await self.hass.async_add_executor_job(discovery.stop_discovery, browser)
 
         except (ConnectionError, TimeoutError, OSError, AttributeError) as err:
             _LOGGER.error("Error setting up Chromecast: %s", err)
@@ -873,28 +1112,15 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         if isinstance(media_type, str) and "/" in media_type:
             return media_type
 
-        # Determine content type from URL extension or media_type
-        media_url_lower = media_url.lower()
-
-        if media_type == MediaType.MUSIC or any(
-            media_url_lower.endswith(ext)
-            for ext in [".mp3", ".wav", ".flac", ".m4a", ".aac"]
-        ):
+        # Music always plays as audio; audio file extensions win over VIDEO
+        if media_type == MediaType.MUSIC:
             return "audio/mpeg"
-
-        if media_type == MediaType.VIDEO or any(
-            media_url_lower.endswith(ext) for ext in [".mp4", ".avi", ".mkv", ".webm"]
-        ):
+        content_type = _CONTENT_TYPES.get(media_url.rpartition(".")[2].lower())
+        if media_type == MediaType.VIDEO and content_type != "audio/mpeg":
             return "video/mp4"
 
-        if media_url_lower.endswith(".m3u8"):
-            return "application/x-mpegURL"
-
-        if media_url_lower.endswith(".pls"):
-            return "audio/x-scpls"
-
         # Default to audio for unknown types
-        return "audio/mpeg"
+        return content_type or "audio/mpeg"
 
     async def async_browse_media(
         self,
@@ -905,25 +1131,24 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         return await media_source.async_browse_media(
             self.hass,
             media_content_id,
-            # Filter to only show audio content that the speaker can likely play
-            content_filter=lambda item: (
-                item.media_content_type.startswith("audio/")
-                or item.media_content_type == MediaType.MUSIC
-                or item.media_class in {"music", "podcast", "audiobook"}
-            ),
+            content_filter=_is_playable_audio,
         )
 
     async def async_join_players(self, group_members: list[str]) -> None:
         """Join `group_members` as a player group with the current player."""
         registry = er.async_get(self.hass)
-        entities = [registry.async_get(entity_id) for entity_id in group_members]
-
-        guids = [
-            self.hass.data[DOMAIN][entity.config_entry_id]
-            .get("system_info", {})
-            .get("guid", None)
-            for entity in entities
-        ]
+        domain_data = self.hass.data[DOMAIN]
+
+        # Skip members that aren't registered or whose entry isn't loaded
+        guids = []
+        for entity_id in group_members:
+            entity = registry.async_get(entity_id)
+            if entity is None or entity.config_entry_id not in domain_data:
+                _LOGGER.warning("Cannot group %s: speaker not loaded", entity_id)
+                continue
+            guids.append(
+                domain_data[entity.config_entry_id].get("system_info", {}).get("guid")
+            )
 
         if self._active_group_id is not None:
             master_id = (
@@ -936,7 +1161,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                     master_id,
                 )
                 _LOGGER.warning("Running action on master speaker")
-                master: BoseSpeaker = self.hass.data[DOMAIN][
+                master: BoseSpeaker = domain_data[
                     registry.async_get(master_id).config_entry_id
                 ]["speaker"]
                 await master.add_to_active_group(self._active_group_id, guids)
@@ -945,7 +1170,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             await self.speaker.add_to_active_group(self._active_group_id, guids)
         else:
             await self.speaker.set_active_group(guids)
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_unjoin_player(self) -> None:
         """Unjoin the player from a group."""
@@ -976,6 +1201,31 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                 self._active_group_id, [self._device_id]
             )
 
+    def _state_fingerprint(self) -> tuple:
+        """Return the state-visible attributes written to Home Assistant."""
+        return (
+            self._attr_state,
+            self.source,
+            tuple(self.source_list or ()),
+            self._attr_volume_level,
+            self._attr_is_volume_muted,
+            self._attr_media_title,
+            self._attr_media_artist,
+            self._attr_media_album_name,
+            self._attr_media_duration,
+            self._attr_media_position,
+            self._attr_media_image_url,
+            tuple(self._attr_group_members),
+            self.supported_features,
+        )
+
+    def _async_write_state_if_changed(self) -> None:
+        """Write the state to Home Assistant only if it changed."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint != self._last_fingerprint:
+            self._last_fingerprint = fingerprint
+            self.async_write_ha_state()
+
     def _has_linked_media_player(self) -> bool:
         """Check if current source has a linked media player."""
         return self._attr_source in self._linked_media_players
@@ -999,43 +1249,36 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
     @property
     def source_list(self) -> list[str] | None:  # pyright: ignore[reportIncompatibleVariableOverride]
         """Return the list of available input sources."""
-        renamed_list = [
-            self._get_source_display_name(source) for source in self._attr_source_list
-        ]
-
         if self._attr_source == "Chromecast built-in":
-            return ["Chromecast built-in"] + renamed_list
+            return self._source_list_with_cast
 
-        return renamed_list
+        return self._renamed_source_list
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:  # pyright: ignore[reportIncompatibleVariableOverride]
         """Return the features supported by this media player."""
-        now = self._now_playing_result or {}
-
-        def _can(key: str) -> bool:
-            if isinstance(now, dict):
-                state = now.get("state") or {}
-                return bool(state.get(key, False))
-
-            state = getattr(now, "state", None)
-            if isinstance(state, dict):
-                return bool(state.get(key, False))
-
-            get_fn = getattr(now, "get", None)
-            if callable(get_fn):
-                try:
-                    state = get_fn("state", {})
-                except (AttributeError, TypeError):
-                    return False
-                if isinstance(state, dict):
-                    return bool(state.get(key, False))
-                return False
+        # Only recomputed when the nowPlaying result or Chromecast changes
+        now = self._now_playing_result
+        has_cast = self._chromecast_device is not None
+        if (
+            self._features is None
+            or now is not self._features_now
+            or has_cast != self._features_cast
+        ):
+            self._features = self._compute_supported_features()
+            self._features_now = now
+            self._features_cast = has_cast
+        return self._features
+
+    def _compute_supported_features(self) -> MediaPlayerEntityFeature:
+        """Compute the supported features from the nowPlaying result."""
+        if not self._now_playing_result:
+            return MediaPlayerEntityFeature.PLAY
 
-            return bool(getattr(state, key, False))
+        state = self._now_state
 
-        if not now:
-            return MediaPlayerEntityFeature.PLAY
+        def _can(key: str) -> bool:
+            return bool(state.get(key, False))
 
         return (
             MediaPlayerEntityFeature.TURN_OFF
@@ -1,5 +1,9 @@
 """Support for Bose adjustable sound settings (sliders)."""
 
+import asyncio
+from dataclasses import dataclass
+import logging
+
 from pybose.BoseResponse import Audio
 from pybose.BoseSpeaker import BoseSpeaker
 
@@ -17,70 +21,47 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import _LOGGER, DOMAIN
+from .const import DOMAIN
 from .entity import BoseBaseEntity
 
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AdjustableParameter:
+    """An adjustable sound parameter exposed as a slider."""
+
+    display: str
+    path: str
+    option: str
+    min: int
+    max: int
+    step: int
+    translation_key: str | None = None
+
+
 # Define adjustable sound parameters
-ADJUSTABLE_PARAMETERS = [
-    {
-        "display": "Bass",
-        "path": "/audio/bass",
-        "option": "bass",
-        "min": -100,
-        "max": 100,
-        "step": 10,
-    },
-    {
-        "display": "Treble",
-        "path": "/audio/treble",
-        "option": "treble",
-        "min": -100,
-        "max": 100,
-        "step": 10,
-    },
-    {
-        "display": "Center",
-        "path": "/audio/center",
-        "option": "center",
-        "min": -100,
-        "max": 100,
-        "step": 10,
-    },
-    {
-        "display": "Subwoofer Gain",
-        "path": "/audio/subwooferGain",
-        "option": "subwooferGain",
-        "translation_key": "subwoofer_gain",
-        "min": -100,
-        "max": 100,
-        "step": 10,
-    },
-    {
-        "display": "Rear Speaker Gain",
-        "path": "/audio/surround",
-        "option": "surround",
-        "min": -100,
-        "max": 100,
-        "step": 10,
-    },
-    {
-        "display": "Height",
-        "path": "/audio/height",
-        "option": "height",
-        "min": -100,
-        "max": 100,
-        "step": 10,
-    },
-    {
-        "display": "AV Sync",
-        "path": "/audio/avSync",
-        "option": "avSync",
-        "translation_key": "av_sync",
-        "min": 0,
-        "max": 200,
-        "step": 10,
-    },
-]
+ADJUSTABLE_PARAMETERS: tuple[AdjustableParameter, ...] = (
+    AdjustableParameter("Bass", "/audio/bass", "bass", -100, 100, 10),
+    AdjustableParameter("Treble", "/audio/treble", "treble", -100, 100, 10),
+    AdjustableParameter("Center", "/audio/center", "center", -100, 100, 10),
+    AdjustableParameter(
+        "Subwoofer Gain",
+        "/audio/subwooferGain",
+        "subwooferGain",
+        -100,
+        100,
+        10,
+        translation_key="subwoofer_gain",
+    ),
+    AdjustableParameter(
+        "Rear Speaker Gain", "/audio/surround", "surround", -100, 100, 10
+    ),
+    AdjustableParameter("Height", "/audio/height", "height", -100, 100, 10),
+    AdjustableParameter(
+        "AV Sync", "/audio/avSync", "avSync", 0, 200, 10, translation_key="av_sync"
+    ),
+)
 
 
 async def async_setup_entry(
@@ -90,18 +71,35 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bose number entities (sliders) for sound settings."""
     speaker: BoseSpeaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
+    endpoints = hass.data[DOMAIN][config_entry.entry_id]["endpoints"]
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
     # Fetch system info
     system_info = await speaker.get_system_info()
 
+    parameters = [
+        parameter for parameter in ADJUSTABLE_PARAMETERS if parameter.path in endpoints
+    ]
+    # Fetch all supported settings at once instead of one request per slider
+    await coordinator.get_all_audio_settings(
+        [parameter.option for parameter in parameters]
+    )
+
     entities = [
         BoseAudioSlider(
             speaker, system_info, config_entry, parameter, hass, coordinator
         )
-        for parameter in ADJUSTABLE_PARAMETERS
-        if speaker.has_capability(parameter["path"])
+        for parameter in parameters
     ]
+    # Served from the coordinator cache filled above
+    results = await asyncio.gather(
+        *(entity.async_update() for entity in entities), return_exceptions=True
+    )
+    for entity, result in zip(entities, results, strict=True):
+        if isinstance(result, Exception):
+            _LOGGER.warning(
+                "Initial update of %s failed: %s", entity.translation_key, result
+            )
 
     async_add_entities(entities)
 
@@ -114,7 +112,7 @@ class BoseAudioSlider(BoseBaseEntity, NumberEntity):
         speaker: BoseSpeaker,
         speaker_info,
         config_entry,
-        parameter,
+        parameter: AdjustableParameter,
         hass: HomeAssistant,
         coordinator,
     ) -> None:
@@ -123,17 +121,17 @@ class BoseAudioSlider(BoseBaseEntity, NumberEntity):
         self.speaker_info = speaker_info
         self.config_entry = config_entry
         self.coordinator = coordinator
-        self._path = parameter.get("path")
-        self._option = parameter.get("option")
+        self._path = parameter.path
+        self._option = parameter.option
         self._attr_native_value = None
-        self._attr_min_value = parameter.get("min")
-        self._attr_max_value = parameter.get("max")
-        self._attr_step = parameter.get("step")
-        self._attr_native_min_value = parameter.get("min")
-        self._attr_native_max_value = parameter.get("max")
-        self._attr_native_step = parameter.get("step")
+        self._attr_min_value = parameter.min
+        self._attr_max_value = parameter.max
+        self._attr_step = parameter.step
+        self._attr_native_min_value = parameter.min
+        self._attr_native_max_value = parameter.max
+        self._attr_native_step = parameter.step
         self._attr_icon = "mdi:sine-wave"
-        self._attr_translation_key = parameter.get("translation_key", self._option)
+        self._attr_translation_key = parameter.translation_key or self._option
         self._cf_unique_id = self._option
         self._attr_capability_attributes = {
             ATTR_MIN: self._attr_min_value,
@@ -145,17 +143,18 @@ class BoseAudioSlider(BoseBaseEntity, NumberEntity):
 
         self._attr_entity_category = EntityCategory.CONFIG
 
-        self.speaker.attach_receiver(self._parse_message)
+        self._dispatcher = hass.data[DOMAIN][config_entry.entry_id]["dispatcher"]
+        self._message_resource = self._path
 
-        hass.async_create_task(self.async_update())
-
-    def _parse_message(self, data):
+    def _parse_message(self, body):
         """Parse the message from the speaker."""
-        if data.get("header", {}).get("resource") == self._path:
-            self._parse_audio(Audio(data.get("body")))
+        self._parse_audio(Audio(body))
 
     def _parse_audio(self, data: Audio):
-        self._attr_native_value = data.get("value", 0)
+        value = data.get("value", 0)
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
         if self.hass:
             self.async_write_ha_state()
 
@@ -163,8 +162,6 @@ class BoseAudioSlider(BoseBaseEntity, NumberEntity):
         """Fetch the current value of the setting."""
         audio_dict = await self.coordinator.get_audio_setting(self._option)
         self._parse_audio(Audio(audio_dict))
-        if self.hass:
-            self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the new value for the setting."""
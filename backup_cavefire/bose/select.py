@@ -1,5 +1,8 @@
 """Support for Bose source selection."""
 
+import asyncio
+import logging
+
 from pybose.BoseResponse import (
     AudioMode,
     CecSettings,
@@ -17,6 +20,8 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .const import DOMAIN
 from .entity import BoseBaseEntity
 
+_LOGGER = logging.getLogger(__name__)
+
 HUMINZED_OPTIONS = {
     # Audio Mode
     "DYNAMIC_DIALOG": "dynamic_dialog",
@@ -39,6 +44,7 @@ HUMINZED_OPTIONS = {
     "ALTMODE_6": "option6",
     "ALTMODE_7": "option7",
 }
+HUMANIZED_TO_REAL = {v: k for k, v in HUMINZED_OPTIONS.items()}
 
 
 async def async_setup_entry(
@@ -48,24 +54,33 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bose select entity."""
     speaker: BoseSpeaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
+    endpoints = hass.data[DOMAIN][config_entry.entry_id]["endpoints"]
     system_info = hass.data[DOMAIN][config_entry.entry_id]["system_info"]
 
     entities = []
 
-    if speaker.has_capability("/audio/mode"):
+    if "/audio/mode" in endpoints:
         entities.append(BoseAudioSelect(speaker, system_info, config_entry, hass))
 
-    if speaker.has_capability("/audio/dualMonoSelect"):
+    if "/audio/dualMonoSelect" in endpoints:
         entities.append(BoseDualMonoSelect(speaker, system_info, config_entry, hass))
 
-    if speaker.has_capability("/audio/rebroadcastLatency/mode"):
+    if "/audio/rebroadcastLatency/mode" in endpoints:
         entities.append(
             BoseRebroadcastLatencyModeSelect(speaker, system_info, config_entry, hass)
         )
 
-    if speaker.has_capability("/cec"):
+    if "/cec" in endpoints:
         entities.append(BoseCecSettingsSelect(speaker, system_info, config_entry, hass))
 
+    results = await asyncio.gather(
+        *(entity.async_update() for entity in entities), return_exceptions=True
+    )
+    for entity, result in zip(entities, results, strict=True):
+        if isinstance(result, Exception):
+            _LOGGER.warning(
+                "Initial update of %s failed: %s", entity.translation_key, result
+            )
     async_add_entities(entities, update_before_add=False)
 
 
@@ -97,43 +112,41 @@ class BoseBaseSelect(BoseBaseEntity, SelectEntity):
 
         self._attr_translation_key = unique_id_suffix.replace("_select", "")
         self._attr_options = []
+        self._last_body_key: tuple | None = None
         self._attr_entity_category = EntityCategory.CONFIG
 
-        self.speaker.attach_receiver(self._parse_message)
-
-        hass.async_create_task(self.async_update())
+        self._dispatcher = hass.data[DOMAIN][config_entry.entry_id]["dispatcher"]
+        self._message_resource = self._resource_path
 
     async def async_select_option(self, option: str) -> None:
         """Change the audio mode on the speaker."""
-
-        for real_option, huminzed_option in HUMINZED_OPTIONS.items():
-            if option == huminzed_option:
-                option = real_option
-                break
-
+        option = HUMANIZED_TO_REAL.get(option, option)
         await getattr(self.speaker, self._set_method)(option)
 
     def _parse_audio_mode(self, data, mode_type):
         selected_audio = data.get(self._value_key)
         supported = data.get("properties", {}).get(self._supported_key, [])
+        # Speakers re-send identical snapshots; skip them before humanizing
+        key = (selected_audio, tuple(supported))
+        if key == self._last_body_key:
+            return
+        self._last_body_key = key
+
         self._attr_options = [
             str(HUMINZED_OPTIONS.get(option, option))
             for option in supported
             if option is not None
         ]
-
-        if HUMINZED_OPTIONS.get(selected_audio):
-            self._attr_current_option = HUMINZED_OPTIONS.get(selected_audio)
-        else:
-            self._attr_current_option = selected_audio
+        self._attr_current_option = (
+            HUMINZED_OPTIONS.get(selected_audio) or selected_audio
+        )
 
         if self.hass:
             self.async_write_ha_state()
 
-    def _parse_message(self, data):
+    def _parse_message(self, body):
         """Parse real-time messages from the speaker."""
-        if data.get("header", {}).get("resource") == self._resource_path:
-            self._parse_audio_mode(data.get("body", {}), self._mode_class)
+        self._parse_audio_mode(body or {}, self._mode_class)
 
     async def async_update(self) -> None:
         """Fetch the current audio mode."""
@@ -19,6 +19,13 @@ from .bose.wifi import BoseWifiBase
 from .const import DOMAIN
 from .entity import BoseBaseEntity
 
+# Display labels for network interface types
+_NETWORK_TYPE_LABELS = {
+    NetworkTypeEnum.WIRELESS: "WiFi",
+    NetworkTypeEnum.WIRED_ETH: "Ethernet",
+    NetworkTypeEnum.WIRED_USB: "USB",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,11 +34,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bose battery, WiFi, and network sensors if supported."""
     speaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
+    endpoints = hass.data[DOMAIN][config_entry.entry_id]["endpoints"]
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
     entities = []
 
-    if speaker.has_capability("/system/battery"):
+    if "/system/battery" in endpoints:
         entities.extend(
             [
                 BoseBatteryLevelSensor(speaker, config_entry, hass, coordinator),
@@ -40,7 +48,7 @@ async def async_setup_entry(
             ]
         )
 
-    if speaker.has_capability("/network/status"):
+    if "/network/status" in endpoints:
         entities.extend(
             [
                 BoseNetworkTypeSensor(speaker, config_entry, hass, coordinator),
@@ -49,18 +57,15 @@ async def async_setup_entry(
         )
 
         try:
-            network_data = await coordinator.get_network_status()
-            network_status = NetworkStatus(network_data)
+            network_status: NetworkStatus = await coordinator.get_network_status()
             primary_name = network_status.get("primary")
 
-            is_wireless_primary = False
-            for interface in network_status.get("interfaces", []):
-                if interface.get("type") == primary_name:
-                    if interface.get("type") == NetworkTypeEnum.WIRELESS:
-                        is_wireless_primary = True
-                    break
+            is_wireless_primary = primary_name == NetworkTypeEnum.WIRELESS and any(
+                interface.get("type") == primary_name
+                for interface in network_status.get("interfaces", [])
+            )
 
-            if is_wireless_primary and speaker.has_capability("/network/wifi/status"):
+            if is_wireless_primary and "/network/wifi/status" in endpoints:
                 entities.extend(
                     [
                         BoseWifiSignalSensor(speaker, config_entry, hass, coordinator),
@@ -214,23 +219,29 @@ class BoseNetworkTypeSensor(BoseBaseEntity, BoseNetworkBase, SensorEntity):
         self._attr_translation_key = "network_type"
         self._attr_icon = "mdi:network"
         self._attr_entity_category = None
+        self._primary_name: str | None = None
 
     def update_from_network_status(self, network_status: NetworkStatus):
         """Update sensor state."""
+        # The value only depends on the primary interface type
         primary_name = network_status.get("primary")
-
-        for interface in network_status.get("interfaces", []):
-            if interface.get("type") == primary_name:
-                network_type = interface.get("type", "UNKNOWN")
-                if network_type == NetworkTypeEnum.WIRELESS:
-                    self._attr_native_value = "WiFi"
-                elif network_type == NetworkTypeEnum.WIRED_ETH:
-                    self._attr_native_value = "Ethernet"
-                elif network_type == NetworkTypeEnum.WIRED_USB:
-                    self._attr_native_value = "USB"
-                else:
-                    self._attr_native_value = str(network_type)
-                break
+        if primary_name is not None and primary_name == self._primary_name:
+            return
+
+        interface = next(
+            (
+                interface
+                for interface in network_status.get("interfaces", [])
+                if interface.get("type") == primary_name
+            ),
+            None,
+        )
+        if interface is not None:
+            network_type = interface.get("type", "UNKNOWN")
+            self._attr_native_value = _NETWORK_TYPE_LABELS.get(
+                network_type, str(network_type)
+            )
+            self._primary_name = primary_name
 
 
 class BoseNetworkIpSensor(BoseBaseEntity, BoseNetworkBase, SensorEntity):
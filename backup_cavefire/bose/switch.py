@@ -1,5 +1,6 @@
 """Support for Bose power switch."""
 
+import logging
 from typing import Any
 
 from pybose.BoseResponse import Accessories, SystemInfo, SystemTimeout
@@ -8,12 +9,14 @@ from pybose.BoseSpeaker import BoseSpeaker
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import _LOGGER, DOMAIN
+from .const import DOMAIN
 from .entity import BoseBaseEntity
 
+_LOGGER = logging.getLogger(__name__)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -22,27 +25,36 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bose switch."""
     speaker: BoseSpeaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
+    endpoints = hass.data[DOMAIN][config_entry.entry_id]["endpoints"]
 
     # Fetch system info
     system_info = hass.data[DOMAIN][config_entry.entry_id]["system_info"]
     accessories = hass.data[DOMAIN][config_entry.entry_id]["accessories"]
 
-    entities: list[SwitchEntity] = []
-    if speaker.has_capability("/system/power/timeouts"):
-        entities.append(
-            BoseStandbySettingSwitch(speaker, system_info, config_entry, hass)
+    if "/system/power/timeouts" in endpoints:
+        # Fetched once by the standard first update before the entity is added
+        async_add_entities(
+            [BoseStandbySettingSwitch(speaker, system_info, config_entry, hass)],
+            update_before_add=True,
         )
     else:
         _LOGGER.debug("Speaker does not support system timeouts")
 
+    # Accessory switches start from the accessories cached at setup
+    entities: list[SwitchEntity] = []
+
     if accessories:
         if accessories.get("controllable", {}).get("subs", False):
             entities.append(
-                BoseSubwooferSwitch(speaker, system_info, accessories, config_entry)
+                BoseSubwooferSwitch(
+                    speaker, system_info, accessories, config_entry, hass
+                )
             )
         if accessories.get("controllable", {}).get("rears", False):
             entities.append(
-                BoseRearSpeakerSwitch(speaker, system_info, accessories, config_entry)
+                BoseRearSpeakerSwitch(
+                    speaker, system_info, accessories, config_entry, hass
+                )
             )
 
     # Add switch entity with device info
@@ -61,6 +73,7 @@ class BoseAccessorySwitch(BoseBaseEntity, SwitchEntity):
         speaker_info: SystemInfo,
         accessories: Accessories,
         config_entry,
+        hass: HomeAssistant,
         name: str,
         attribute: str,
     ) -> None:
@@ -76,7 +89,8 @@ class BoseAccessorySwitch(BoseBaseEntity, SwitchEntity):
         self._attr_translation_key = attribute
         self.icon = "mdi:speaker"
 
-        self.speaker.attach_receiver(self._parse_message)
+        self._dispatcher = hass.data[DOMAIN][config_entry.entry_id]["dispatcher"]
+        self._message_resource = "/accessories"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the speaker feature."""
@@ -88,15 +102,19 @@ class BoseAccessorySwitch(BoseBaseEntity, SwitchEntity):
         await self.speaker.put_accessories(**{f"{self._attribute}_enabled": False})
         self.async_write_ha_state()
 
-    def _parse_message(self, data):
+    @callback
+    def _parse_message(self, body):
         """Parse the message from the speaker."""
-        if data.get("header", {}).get("resource") == "/accessories":
-            self._parse_accessories(Accessories(data.get("body")))
+        self._parse_accessories(body)
 
+    @callback
     def _parse_accessories(self, data: Accessories):
         """Parse the accessories data."""
         enabled = data.get("enabled", {}) if data else {}
-        self._attr_is_on = enabled.get(self._attribute, False) if enabled else False
+        is_on = enabled.get(self._attribute, False) if enabled else False
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
@@ -113,10 +131,17 @@ class BoseSubwooferSwitch(BoseAccessorySwitch):
         speaker_info: SystemInfo,
         accessories: Accessories,
         config_entry,
+        hass: HomeAssistant,
     ) -> None:
         """Initialize the switch."""
         super().__init__(
-            speaker, speaker_info, accessories, config_entry, "Subwoofers", "subs"
+            speaker,
+            speaker_info,
+            accessories,
+            config_entry,
+            hass,
+            "Subwoofers",
+            "subs",
         )
 
 
@@ -129,10 +154,17 @@ class BoseRearSpeakerSwitch(BoseAccessorySwitch):
         speaker_info: SystemInfo,
         accessories: Accessories,
         config_entry,
+        hass: HomeAssistant,
     ) -> None:
         """Initialize the switch."""
         super().__init__(
-            speaker, speaker_info, accessories, config_entry, "Rear Speakers", "rears"
+            speaker,
+            speaker_info,
+            accessories,
+            config_entry,
+            hass,
+            "Rear Speakers",
+            "rears",
         )
 
 
@@ -157,15 +189,17 @@ class BoseStandbySettingSwitch(BoseBaseEntity, SwitchEntity):
 
         self._attr_entity_category = EntityCategory.CONFIG
 
-        self.speaker.attach_receiver(self._parse_message)
-        hass.async_create_task(self.async_update())
+        self._dispatcher = hass.data[DOMAIN][config_entry.entry_id]["dispatcher"]
+        self._message_resource = "/system/power/timeouts"
 
-    def _parse_message(self, data):
+    @callback
+    def _parse_message(self, body: SystemTimeout):
         """Parse the message from the speaker."""
-        if data.get("header", {}).get("resource") == "/system/power/timeouts":
-            result: SystemTimeout = data.get("body")
-            self._attr_is_on = result.get("noAudio", False)
-            self.async_write_ha_state()
+        is_on = body.get("noAudio", False)
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the speaker feature."""
@@ -182,4 +216,3 @@ class BoseStandbySettingSwitch(BoseBaseEntity, SwitchEntity):
         self._attr_is_on = (await self.speaker.get_system_timeout()).get(
             "noAudio", False
         )
-        self.async_write_ha_state()
@@ -1,35 +1,102 @@
 """The Bose SoundTouch Local integration."""
+import asyncio
+from datetime import timedelta
 import logging
-from bosesoundtouchapi import SoundTouchDevice
+import time
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, DATA_SOUNDTOUCH
+from .api import SoundTouchAsyncClient
+
+from .const import DOMAIN, DATA_SOUNDTOUCH, PRESETS_REFRESH_INTERVAL, SCAN_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER]
 
+
+class SoundTouchCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Poll a SoundTouch device once for all of its entities."""
+
+    def __init__(
+        self, hass: HomeAssistant, client: SoundTouchAsyncClient, host: str
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{host}",
+            update_interval=timedelta(seconds=SCAN_INTERVAL),
+        )
+        self.client = client
+        self._presets_fetched_at: float | None = None
+
+    def invalidate_presets(self) -> None:
+        """Refetch the presets on the next update."""
+        self._presets_fetched_at = None
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the status and volume, and the presets when they are due."""
+        client = self.client
+        now = time.monotonic()
+        # Presets rarely change; refetch them only every few minutes or
+        # after invalidate_presets
+        refresh_presets = (
+            self._presets_fetched_at is None
+            or now - self._presets_fetched_at > PRESETS_REFRESH_INTERVAL
+        )
+        requests = [client.get_now_playing(), client.get_volume()]
+        if refresh_presets:
+            requests.append(client.get_presets())
+        try:
+            status, volume, *presets = await asyncio.gather(*requests)
+        except Exception as ex:
+            raise UpdateFailed(f"Error updating SoundTouch device: {ex}") from ex
+        if refresh_presets:
+            self._presets_fetched_at = now
+            return {"status": status, "volume": volume, "presets": presets[0]}
+        return {**self.data, "status": status, "volume": volume}
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Bose SoundTouch Local from a config entry."""
     host = entry.data[CONF_HOST]
 
-    try:
-        # Initialize the device
-        device = await hass.async_add_executor_job(SoundTouchDevice, host)
-        
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][entry.entry_id] = device
+    client = SoundTouchAsyncClient(async_get_clientsession(hass), host)
 
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # One poll per device, shared by its entities
+    coordinator = SoundTouchCoordinator(hass, client, host)
 
-        return True
-    except Exception as ex:
-        _LOGGER.error("Could not connect to Bose SoundTouch at %s: %s", host, ex)
+    # Probe the device for its ID while the first poll runs
+    device_id, refreshed = await asyncio.gather(
+        client.get_device_id(),
+        coordinator.async_config_entry_first_refresh(),
+        return_exceptions=True,
+    )
+    if isinstance(refreshed, BaseException):
+        raise refreshed
+    if isinstance(device_id, BaseException):
+        _LOGGER.error(
+            "Could not connect to Bose SoundTouch at %s: %s", host, device_id
+        )
         return False
 
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = {
+        "client": client,
+        "device_id": device_id,
+        "coordinator": coordinator,
+    }
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    return True
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -0,0 +1,129 @@
+"""Async client for the Bose SoundTouch local web API."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+import aiohttp
+
+from .const import DEFAULT_PORT
+
+# Seconds to wait for a single request to the device
+REQUEST_TIMEOUT = 10
+
+
+@dataclass(slots=True)
+class NowPlaying:
+    """Now playing status of a device."""
+
+    source: str | None
+    play_status: str | None
+    item_name: str | None
+    track: str | None
+    artist: str | None
+    album: str | None
+    art_url: str | None
+
+
+@dataclass(slots=True)
+class VolumeStatus:
+    """Volume status of a device."""
+
+    actual: int
+    muted: bool
+
+
+@dataclass(slots=True)
+class Preset:
+    """A stored preset of a device."""
+
+    preset_id: int
+    name: str | None
+
+
+class SoundTouchAsyncClient:
+    """Talk to a SoundTouch device over its XML HTTP API."""
+
+    def __init__(
+        self, session: aiohttp.ClientSession, host: str, port: int = DEFAULT_PORT
+    ) -> None:
+        """Initialize the client; the session is shared and not owned."""
+        self._session = session
+        self._base_url = f"http://{host}:{port}"
+        self._timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+
+    async def _get(self, path: str) -> Element:
+        async with self._session.get(
+            self._base_url + path, timeout=self._timeout
+        ) as response:
+            response.raise_for_status()
+            return ElementTree.fromstring(await response.read())
+
+    async def _post(self, path: str, body: str) -> None:
+        async with self._session.post(
+            self._base_url + path, data=body.encode(), timeout=self._timeout
+        ) as response:
+            response.raise_for_status()
+
+    async def get_device_id(self) -> str | None:
+        """Return the device ID reported by /info."""
+        return (await self._get("/info")).get("deviceID")
+
+    async def get_now_playing(self) -> NowPlaying:
+        """Return the now playing status."""
+        root = await self._get("/now_playing")
+        content_item = root.find("ContentItem")
+        return NowPlaying(
+            source=root.get("source"),
+            play_status=root.findtext("playStatus"),
+            item_name=(
+                content_item.findtext("itemName") if content_item is not None else None
+            ),
+            track=root.findtext("track"),
+            artist=root.findtext("artist"),
+            album=root.findtext("album"),
+            art_url=root.findtext("art"),
+        )
+
+    async def get_volume(self) -> VolumeStatus:
+        """Return the volume status."""
+        root = await self._get("/volume")
+        return VolumeStatus(
+            actual=int(root.findtext("actualvolume") or 0),
+            muted=root.findtext("muteenabled") == "true",
+        )
+
+    async def get_presets(self) -> list[Preset]:
+        """Return the stored presets."""
+        root = await self._get("/presets")
+        return [
+            Preset(
+                preset_id=int(preset.get("id", 0)),
+                name=preset.findtext("ContentItem/itemName"),
+            )
+            for preset in root.iter("preset")
+        ]
+
+    async def key(self, value: str, state: str = "press") -> None:
+        """Send a key event such as PLAY to the device."""
+        await self._post("/key", f'<key state="{state}" sender="Gabbo">{value}</key>')
+
+    async def press_key(self, value: str) -> None:
+        """Press and release a key."""
+        await self.key(value, "press")
+        await self.key(value, "release")
+
+    async def select_preset(self, preset_id: int) -> None:
+        """Play a stored preset (a press would start storing one instead)."""
+        await self.key(f"PRESET_{preset_id}", "release")
+
+    async def set_volume(self, volume: int) -> None:
+        """Set the volume (0..100)."""
+        await self._post("/volume", f"<volume>{volume}</volume>")
+
+    async def set_power(self, on: bool) -> None:
+        """Turn the device on or off; POWER toggles, so check standby first."""
+        standby = (await self.get_now_playing()).source == "STANDBY"
+        if standby == on:
+            await self.press_key("POWER")
@@ -15,6 +15,8 @@ class SoundTouchLocalConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    _host: str
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         errors = {}
@@ -38,9 +40,16 @@ class SoundTouchLocalConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle zeroconf discovery."""
         host = discovery_info.host
         name = discovery_info.name.split(".")[0]
-        
-        await self.async_set_unique_id(host)
-        self._abort_if_unique_id_configured()
+
+        # Entries added by hand are keyed by host
+        self._async_abort_entries_match({CONF_HOST: host})
+
+        # Key discovered devices by MAC so an IP change updates the entry
+        # instead of adding a duplicate
+        mac = discovery_info.properties.get("MAC")
+        await self.async_set_unique_id(mac.lower() if mac else host)
+        self._abort_if_unique_id_configured(updates={CONF_HOST: host})
+        self._host = host
 
         self.context.update({
             "title_placeholders": {"name": name},
@@ -55,7 +64,7 @@ class SoundTouchLocalConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(
                 title=self.context["title_placeholders"]["name"],
                 data={
-                    CONF_HOST: self.unique_id,
+                    CONF_HOST: self._host,
                     CONF_NAME: self.context["title_placeholders"]["name"],
                 }
             )
@@ -7,6 +7,11 @@ CONF_PORT = "port"
 
 DEFAULT_PORT = 8090
 
+# Seconds between polls of a device
+SCAN_INTERVAL = 15
+# Seconds between refreshes of a device's preset list
+PRESETS_REFRESH_INTERVAL = 300
+
 ATTR_PRESETS = "presets"
 ATTR_SOURCE = "source"
 ATTR_GROUP_MEMBERS = "group_members"
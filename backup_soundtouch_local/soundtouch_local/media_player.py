@@ -1,9 +1,5 @@
 """Support for Bose SoundTouch devices."""
 import logging
-from typing import Any
-
-from bosesoundtouchapi import SoundTouchDevice
-from bosesoundtouchapi.models import Status, Volume
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -13,9 +9,12 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import SoundTouchCoordinator
+from .api import NowPlaying, Preset, SoundTouchAsyncClient, VolumeStatus
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,140 +32,155 @@ SUPPORT_SOUNDTOUCH = (
     | MediaPlayerEntityFeature.TURN_ON
 )
 
+# Device play status -> media player state; anything else is off
+_PLAY_STATE_MAP = {
+    "PLAY_STATE": MediaPlayerState.PLAYING,
+    "PAUSE_STATE": MediaPlayerState.PAUSED,
+    "STOP_STATE": MediaPlayerState.IDLE,
+}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Bose SoundTouch Local media player."""
-    device = hass.data[DOMAIN][entry.entry_id]
+    data = hass.data[DOMAIN][entry.entry_id]
     name = entry.data[CONF_NAME]
 
-    async_add_entities([SoundTouchMediaPlayer(device, name)], True)
-
-class SoundTouchMediaPlayer(MediaPlayerEntity):
+    async_add_entities(
+        [
+            SoundTouchMediaPlayer(
+                data["coordinator"], data["client"], data["device_id"], name
+            )
+        ]
+    )
+
+class SoundTouchMediaPlayer(
+    CoordinatorEntity[SoundTouchCoordinator], MediaPlayerEntity
+):
     """Representation of a Bose SoundTouch Local media player."""
 
     _attr_has_entity_name = True
     _attr_name: str | None = None
-
-    def __init__(self, device: SoundTouchDevice, name: str) -> None:
+    _attr_supported_features = SUPPORT_SOUNDTOUCH
+
+    def __init__(
+        self,
+        coordinator: SoundTouchCoordinator,
+        client: SoundTouchAsyncClient,
+        device_id: str | None,
+        name: str,
+    ) -> None:
         """Initialize the media player."""
-        self._device = device
+        super().__init__(coordinator)
+        self._client = client
         self._attr_extra_state_attributes = {}
-        self._status: Status = None
-        self._volume: Volume = None
-        self._presets: list = []
-        self._attr_unique_id = device.DeviceId
+        self._status: NowPlaying | None = None
+        self._volume: VolumeStatus | None = None
+        self._presets: list[Preset] = []
+        self._source_map: dict[str | None, int] = {}
+        self._attr_source_list = []
+        self._attr_state = MediaPlayerState.OFF
+        self._attr_unique_id = device_id
         self._attr_name = name
-
-    def update(self) -> None:
-        """Update the state of the media player."""
-        try:
-            self._status = self._device.GetNowPlayingStatus()
-            self._volume = self._device.GetVolume()
-            
-            # Fetch presets periodically (not every update to save bandwidth)
-            if not self._presets:
-                self._presets = self._device.GetPresetList()
-            
-            # Update attributes
-            self._attr_media_title = self._status.Track
-            self._attr_media_artist = self._status.Artist
-            self._attr_media_album_name = self._status.Album
-            self._attr_media_image_url = self._status.ArtUrl
-            self._attr_source = self._status.ContentItem.Name if self._status.ContentItem else None
-            
+        self._update_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the state from the coordinator's latest poll."""
+        self._update_from_data()
+        self.async_write_ha_state()
+
+    def _update_from_data(self) -> None:
+        """Update attributes from the coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            return
+        self._status = data["status"]
+        self._volume = data["volume"]
+        if data["presets"] is not self._presets:
+            self._presets = data["presets"]
+            self._source_map = {
+                preset.name: preset.preset_id for preset in self._presets
+            }
+            self._attr_source_list = list(self._source_map)
             # Expose presets as extra attributes
             self._attr_extra_state_attributes["presets"] = {
-                preset.PresetId: preset.ContentItem.Name for preset in self._presets
+                preset.preset_id: preset.name for preset in self._presets
             }
-            
-        except Exception as ex:
-            _LOGGER.error("Error updating SoundTouch device: %s", ex)
-
-    @property
-    def state(self) -> MediaPlayerState | None:
-        """Return the state of the device."""
-        if not self._status:
-            return MediaPlayerState.OFF
-
-        if self._status.PlayStatus == "PLAY_STATE":
-            return MediaPlayerState.PLAYING
-        if self._status.PlayStatus == "PAUSE_STATE":
-            return MediaPlayerState.PAUSED
-        if self._status.PlayStatus == "STOP_STATE":
-            return MediaPlayerState.IDLE
-            
-        return MediaPlayerState.OFF
-
-    @property
-    def volume_level(self) -> float | None:
-        """Volume level of the media player (0..1)."""
-        if self._volume:
-            return self._volume.ActualVolume / 100.0
-        return None
-
-    @property
-    def is_volume_muted(self) -> bool | None:
-        """Boolean if volume is currently muted."""
-        if self._volume:
-            return self._volume.MuteEnabled
-        return None
-
-    @property
-    def supported_features(self) -> MediaPlayerEntityFeature:
-        """Flag media player features that are supported."""
-        return SUPPORT_SOUNDTOUCH
-
-    def media_play(self) -> None:
+
+        # Update attributes
+        self._attr_media_title = self._status.track
+        self._attr_media_artist = self._status.artist
+        self._attr_media_album_name = self._status.album
+        self._attr_media_image_url = self._status.art_url
+        self._attr_source = self._status.item_name
+        self._attr_state = _PLAY_STATE_MAP.get(
+            self._status.play_status, MediaPlayerState.OFF
+        )
+        self._attr_volume_level = self._volume.actual / 100.0
+        self._attr_is_volume_muted = self._volume.muted
+
+    async def async_media_play(self) -> None:
         """Send play command."""
-        self._device.Play()
+        await self._client.press_key("PLAY")
+        # Not polled: refresh so the command shows before the next update
+        await self.coordinator.async_request_refresh()
 
-    def media_pause(self) -> None:
+    async def async_media_pause(self) -> None:
         """Send pause command."""
-        self._device.Pause()
+        await self._client.press_key("PAUSE")
+        await self.coordinator.async_request_refresh()
 
-    def media_stop(self) -> None:
+    async def async_media_stop(self) -> None:
         """Send stop command."""
-        self._device.Stop()
+        await self._client.press_key("STOP")
+        await self.coordinator.async_request_refresh()
 
-    def media_previous_track(self) -> None:
+    async def async_media_previous_track(self) -> None:
         """Send previous track command."""
-        self._device.PreviousTrack()
+        await self._client.press_key("PREV_TRACK")
+        await self.coordinator.async_request_refresh()
 
-    def media_next_track(self) -> None:
+    async def async_media_next_track(self) -> None:
         """Send next track command."""
-        self._device.NextTrack()
+        await self._client.press_key("NEXT_TRACK")
+        await self.coordinator.async_request_refresh()
 
-    def set_volume_level(self, volume: float) -> None:
+    async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        self._device.SetVolume(int(volume * 100))
+        await self._client.set_volume(int(volume * 100))
+        await self.coordinator.async_request_refresh()
 
-    def mute_volume(self, mute: bool) -> None:
+    async def async_mute_volume(self, mute: bool) -> None:
         """Mute (true) or unmute (false) media player."""
-        self._device.Mute() # This toggles in the API usually, let's verify if specific mute/unmute exists
+        # The MUTE key toggles, so only press it when the state differs; read
+        # it from the device, the polled state may predate a recent press
+        if (await self._client.get_volume()).muted != mute:
+            await self._client.press_key("MUTE")
+        await self.coordinator.async_request_refresh()
 
-    def turn_on(self) -> None:
+    async def async_turn_on(self) -> None:
         """Turn the media player on."""
-        self._device.PowerOn()
+        await self._client.set_power(True)
+        await self.coordinator.async_request_refresh()
 
-    def turn_off(self) -> None:
+    async def async_turn_off(self) -> None:
         """Turn the media player off."""
-        self._device.PowerOff()
+        await self._client.set_power(False)
+        await self.coordinator.async_request_refresh()
 
-    def select_source(self, source: str) -> None:
+    async def async_select_source(self, source: str) -> None:
         """Select input source."""
         # Mapping sources or presets
-        for preset in self._presets:
-            if preset.ContentItem.Name == source:
-                self._device.SelectPreset(preset.PresetId)
-                return
-        _LOGGER.warning("Source %s not found in presets", source)
-
-    @property
-    def source_list(self) -> list[str] | None:
-        """List of available input sources."""
-        return [preset.ContentItem.Name for preset in self._presets]
+        preset_id = self._source_map.get(source)
+        if preset_id is None:
+            _LOGGER.warning("Source %s not found in presets", source)
+            return
+        await self._client.select_preset(preset_id)
+        # Pick up preset edits made on the device
+        self.coordinator.invalidate_presets()
+        await self.coordinator.async_request_refresh()
 
     # Custom methods for zone management could be added here
@@ -1568,6 +1568,7 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
         # initialize favorites manager.
         favorites_manager = FavoritesManager(hass)
         await favorites_manager.async_load()
+        entry.async_on_unload(favorites_manager.async_unload)
 
         # create media player entity instance data.
         hass.data.setdefault(DOMAIN, {})
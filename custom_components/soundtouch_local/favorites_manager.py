@@ -1,6 +1,7 @@
 """Favorites manager for SoundTouchLocal integration."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
 from typing import Any
 
@@ -13,40 +14,20 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = f"{DOMAIN}.favorites"
 STORAGE_VERSION = 1
+# Seconds to wait for more changes before writing favorites to disk
+SAVE_DELAY = 10
 
+@dataclass(slots=True)
 class SoundTouchFavorite:
     """Class to represent a SoundTouch favorite."""
 
-    def __init__(
-        self,
-        name: str,
-        source: str,
-        item_type: str,
-        location: str,
-        source_account: str | None = None,
-        container_art: str | None = None,
-        is_presetable: bool = True,
-    ) -> None:
-        """Initialize a new SoundTouch favorite."""
-        self.name = name
-        self.source = source
-        self.item_type = item_type
-        self.location = location
-        self.source_account = source_account
-        self.container_art = container_art
-        self.is_presetable = is_presetable
-
-    def to_dict(self) -> dict[str, Any]:
-        """Return a dictionary representation of the favorite."""
-        return {
-            "name": self.name,
-            "source": self.source,
-            "item_type": self.item_type,
-            "location": self.location,
-            "source_account": self.source_account,
-            "container_art": self.container_art,
-            "is_presetable": self.is_presetable,
-        }
+    name: str
+    source: str
+    item_type: str
+    location: str
+    source_account: str | None = None
+    container_art: str | None = None
+    is_presetable: bool = True
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SoundTouchFavorite:
@@ -69,38 +50,62 @@ class FavoritesManager:
         """Initialize the favorites manager."""
         self.hass = hass
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-        self._favorites: list[SoundTouchFavorite] = []
+        # Keyed by (source, location), which identifies a favorite
+        self._favorites: dict[tuple[str, str], SoundTouchFavorite] = {}
+        self._changed = False
 
     async def async_load(self) -> None:
         """Load favorites from storage."""
         data = await self._store.async_load()
+        self._favorites = {}
         if data:
-            self._favorites = [SoundTouchFavorite.from_dict(f) for f in data.get("favorites", [])]
-        else:
-            self._favorites = []
+            for f in data.get("favorites", []):
+                favorite = SoundTouchFavorite.from_dict(f)
+                self._favorites[(favorite.source, favorite.location)] = favorite
 
-    async def async_save(self) -> None:
-        """Save favorites to storage."""
-        await self._store.async_save({
-            "favorites": [f.to_dict() for f in self._favorites]
-        })
+    @callback
+    def async_save(self) -> None:
+        """Schedule saving favorites to storage.
+
+        Bursts of changes are coalesced into a single write; the store
+        flushes any pending write when Home Assistant stops, and
+        async_unload flushes it when the config entry unloads.
+        """
+        self._changed = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_unload(self) -> None:
+        """Write any pending changes before the config entry unloads.
+
+        A reloaded entry loads the file again, so a write still waiting
+        on the save delay would otherwise be lost or overwritten.
+        """
+        if self._changed:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        # The store serializes with orjson, which writes the dataclass fields
+        # directly; they define the stored format
+        return {"favorites": list(self._favorites.values())}
 
     @callback
     def get_favorites(self) -> list[SoundTouchFavorite]:
         """Return the list of favorites."""
-        return self._favorites
+        return list(self._favorites.values())
 
     async def async_add_favorite(self, favorite: SoundTouchFavorite) -> None:
         """Add a favorite to the list and save."""
-        # Check if already exists (by location and source)
-        for f in self._favorites:
-            if f.location == favorite.location and f.source == favorite.source:
-                return # Already exists
-        
-        self._favorites.append(favorite)
-        await self.async_save()
+        key = (favorite.source, favorite.location)
+        if key in self._favorites:
+            return # Already exists
+
+        self._favorites[key] = favorite
+        self.async_save()
 
     async def async_remove_favorite(self, location: str) -> None:
         """Remove a favorite by location and save."""
-        self._favorites = [f for f in self._favorites if f.location != location]
-        await self.async_save()
+        for key in [key for key in self._favorites if key[1] == location]:
+            del self._favorites[key]
+        self.async_save()